@@ -3,7 +3,7 @@
 import asyncio
 
 from ..materials import materials
-from ...rs485 import RS485Client
+from ...rs485 import RS485Client, ParsedResponse
 
 
 class QTM(RS485Client):
@@ -45,9 +45,9 @@ class QTM(RS485Client):
         b: Analog output (b=0 stop, b=1 auto, b=2 manual)
         c: rate calculation algorythm (c=0 immediate, c=1 weighted, c=2 10-average)
         """
-        response: dict = await self.read_parse_registers(8, 1)
-        if response["data"]:
-            coded_str = f"{response['data'][0]:04x}"
+        response: ParsedResponse = await self.read_parse_registers(8, 1)
+        if response.data:
+            coded_str = f"{response.data[0]:04x}"
             a = int(coded_str[0], 16)
             b = int(coded_str[1], 16)
             c = int(coded_str[2], 16)
@@ -55,7 +55,7 @@ class QTM(RS485Client):
             return a, b, c
         return 0, 0, 0
 
-    async def set_con(self, a: int = 1, b: int = 1, c: int = 1) -> dict:
+    async def set_con(self, a: int = 1, b: int = 1, c: int = 1) -> ParsedResponse:
         """
         Set CON values to register.
         a: 0-11 gate time = a * 100ms
@@ -75,16 +75,16 @@ class QTM(RS485Client):
         (x, y) X: running status, Y: film thickness measurement reset.
         x=0 stopped, x=1 started; y=0 no thickness reset, y=1 thickness reset.
         """
-        response: dict = await self.read_parse_registers(9, 1)
-        if response["data"]:
-            coded_str: str = f"{response['data'][0]:04x}"
+        response: ParsedResponse = await self.read_parse_registers(9, 1)
+        if response.data:
+            coded_str: str = f"{response.data[0]:04x}"
             y = int(coded_str[2], 16)
             x = int(coded_str[3], 16)
             self.logger.debug("X: %d, Y: %d", x, y)
             return x, y
         return 0, 0
 
-    async def set_run(self, x: int = 0, y: int = 0) -> dict:
+    async def set_run(self, x: int = 0, y: int = 0) -> ParsedResponse:
         """
         Parse running status.
         (x, y) X: running status, Y: film thickness measurement reset.
@@ -95,11 +95,11 @@ class QTM(RS485Client):
         data = int(f"0x00{int(y):x}{int(x):x}", 16)
         return await self.write_parse_register(9, data)
 
-    async def start_measurement(self) -> dict:
+    async def start_measurement(self) -> ParsedResponse:
         """quick method to start measurement"""
         return await self.set_run(1, 1)
 
-    async def stop_measurement(self) -> dict:
+    async def stop_measurement(self) -> ParsedResponse:
         """quick method to stop measurement"""
         return await self.set_run(0, 0)
 
@@ -194,10 +194,10 @@ class QTM(RS485Client):
 
     async def get_baudrate(self) -> int:
         """Parse RS-485 baudrate value from register data"""
-        response: dict = await self.read_parse_registers(15, 1)
+        response: ParsedResponse = await self.read_parse_registers(15, 1)
         code: int = 0
-        if response["data"]:
-            coded_str: str = f"{response['data'][0]:04x}"
+        if response.data:
+            coded_str: str = f"{response.data[0]:04x}"
             code = int(coded_str[0], 16)
         return self._code_to_baudrate(code)
 
@@ -205,10 +205,10 @@ class QTM(RS485Client):
         """Set RS-485 baudrate value to register"""
         code: int = self._baudrate_to_code(baudrate)
         coded_byte: int = int(f"0x{code}000")
-        response: dict = await self.write_parse_register(15, coded_byte)
+        response: ParsedResponse = await self.write_parse_register(15, coded_byte)
         code = 0
-        if response["data"]:
-            coded_str: str = f"{response['data'][0]:04x}"
+        if response.data:
+            coded_str: str = f"{response.data[0]:04x}"
             code = int(coded_str[0], 16)
         new_baudrate = self._code_to_baudrate(code)
         self.con_params.baudrate = new_baudrate
@@ -217,7 +217,7 @@ class QTM(RS485Client):
     # Get QTM state in single request
     async def get_state(self) -> dict:
         """QTM state in a single request"""
-        response: dict = await self.read_parse_registers(0, 16)
+        response: ParsedResponse = await self.read_parse_registers(0, 16)
         state: dict = {
             "version": 0.0,
             "thickness": 0.0,
@@ -233,30 +233,26 @@ class QTM(RS485Client):
             "addr": 0,
             "baudrate": 0,
         }
-        if response["data"]:
-            state["version"] = response["data"][0] / 100
-            state["thickness"] = (
-                (response["data"][1] << 16) + response["data"][2]
-            ) / 1e2
-            state["rate"] = ((response["data"][3] << 16) + response["data"][4]) / 1e2
-            state["frequency"] = (
-                (response["data"][5] << 16) + response["data"][6]
-            ) / 1e2
-            state["pwm"] = response["data"][7] / 100
-            con_str = f"{response['data'][8]:04x}"
+        if response.data:
+            state["version"] = response.data[0] / 100
+            state["thickness"] = ((response.data[1] << 16) + response.data[2]) / 1e2
+            state["rate"] = ((response.data[3] << 16) + response.data[4]) / 1e2
+            state["frequency"] = ((response.data[5] << 16) + response.data[6]) / 1e2
+            state["pwm"] = response.data[7] / 100
+            con_str = f"{response.data[8]:04x}"
             state["con"] = (
                 int(con_str[0], 16),
                 int(con_str[1], 16),
                 int(con_str[2], 16),
             )
-            run_str = f"{response['data'][9]:04x}"
+            run_str = f"{response.data[9]:04x}"
             state["run"] = (int(run_str[3], 16), int(run_str[2], 16))
-            state["den"] = response["data"][10] / 100
-            state["z_ratio"] = response["data"][11] / 1000
-            state["scale"] = response["data"][12] / 1000
-            state["range"] = response["data"][13]
-            state["addr"] = response["data"][14]
-            bitrate_str = f"{response['data'][15]:04x}"
+            state["den"] = response.data[10] / 100
+            state["z_ratio"] = response.data[11] / 1000
+            state["scale"] = response.data[12] / 1000
+            state["range"] = response.data[13]
+            state["addr"] = response.data[14]
+            bitrate_str = f"{response.data[15]:04x}"
             state["baudrate"] = self._code_to_baudrate(int(bitrate_str[0], 16))
         return state
 
@@ -62,11 +62,12 @@ class QTMSerial(QTM):
             self.address, cmd_code, start_register, count
         )
         self.logger.debug("MSG: %s", msg)
-        con = Serial(**self.con_params.model_dump())
-        con.write(msg)
-        await asyncio.sleep(self.response_delay)
-        response: bytes = con.readline()
-        con.close()
+        async with self.bus_lock:
+            con = Serial(**self.con_params.model_dump())
+            con.write(msg)
+            await asyncio.sleep(self.response_delay)
+            response: bytes = con.readline()
+            con.close()
         return self._get_serial_payload(response)
 
     async def write_register(self, register: int, value: int) -> bytes:
@@ -75,9 +76,10 @@ class QTMSerial(QTM):
         cmd_code: int = 6
         msg: bytes = self._prepare_message(self.address, cmd_code, register, value)
         self.logger.debug("MSG: %s", msg)
-        con = Serial(**self.con_params.model_dump())
-        con.write(msg)
-        await asyncio.sleep(self.response_delay)
-        response: bytes = con.readline()
-        con.close()
+        async with self.bus_lock:
+            con = Serial(**self.con_params.model_dump())
+            con.write(msg)
+            await asyncio.sleep(self.response_delay)
+            response: bytes = con.readline()
+            con.close()
         return self._get_serial_payload(response)
@@ -1,17 +1,48 @@
 """RS-485 module"""
 
-from typing import Union
+from abc import ABC, abstractmethod
+from typing import Generic, NamedTuple, Protocol, TypeVar, Union
+import asyncio
 import logging
 import struct
 from pydantic import BaseModel
 from pymodbus.framer import ModbusAsciiFramer, ModbusRtuFramer
-from pymodbus.pdu import ModbusResponse
+from pymodbus.pdu import ExceptionResponse, ModbusResponse
 from pymodbus.exceptions import ModbusException
 from pymodbus.client import AsyncModbusSerialClient
 
 from .. import get_logger
 
 
+class ParsedResponse(NamedTuple):
+    """Parsed MODBUS response"""
+
+    crc: int = 0
+    addr: int = -1  # 0 is reserved for MODBUS as a broadcast address
+    cmd: int = 0
+    data_length: int = 0
+    register: int = 0
+    reg_count: int = 0
+    data: tuple[int, ...] = ()
+    exception_code: int = 0  # MODBUS exception code of an error response
+
+
+_EMPTY_RESPONSE: ParsedResponse = ParsedResponse()
+
+
+class AddressedResponse(Protocol):
+    """Parsed response carrying the address of the responding device"""
+
+    # pylint: disable=too-few-public-methods
+
+    @property
+    def addr(self) -> Union[int, None]:
+        """Address of the responding device"""
+
+
+ResponseT = TypeVar("ResponseT", bound=AddressedResponse)
+
+
 class SerialConnectionConfig(BaseModel):
     """Model for serial communication configuration"""
 
@@ -95,8 +126,94 @@ async def modbus_write_register(
     return response
 
 
-class RS485Client:
-    """RS-485 Client class"""
+async def modbus_read_write_registers(
+    con_params: Union[SerialConnectionConfig, ModbusSerialConnectionConfig],
+    read_register: int,
+    count: int,
+    write_register: int,
+    values: list[int],
+    slave: int = 1,
+    logger: Union[logging.Logger, None] = None,
+) -> Union[ModbusResponse, None]:
+    """Write values and read registers data in one transaction (function code 0x17)"""
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    response: Union[ModbusResponse, None] = None
+    client = AsyncModbusSerialClient(**modbus_config(con_params))
+    await client.connect()
+    try:
+        response = await client.readwrite_registers(
+            read_address=read_register,
+            read_count=count,
+            write_address=write_register,
+            values=values,
+            slave=slave,
+        )
+    except ModbusException as e:
+        if logger:
+            logger.error("Modbus Exception on read/write registers %s", e)
+    client.close()
+    return response
+
+
+class BusScheduler:
+    """
+    Serializes transactions on a shared bus and keeps the bus idle for the
+    inter-frame gap between them. Pass the same scheduler as bus_lock to all
+    devices connected to the bus.
+    """
+
+    __slots__ = ("gap", "_lock", "_next_free")
+
+    def __init__(self, gap: float = 0.0):
+        self.gap: float = gap
+        self._lock: Union[asyncio.Lock, None] = None
+        self._next_free: float = 0.0
+
+    @classmethod
+    def for_baudrate(cls, baudrate: int) -> "BusScheduler":
+        """Scheduler with MODBUS RTU 3.5 character gap for the given baudrate"""
+        # 11 bits per character, fixed 1.75 ms gap above 19200 baud
+        return cls(3.5 * 11 / baudrate if baudrate <= 19200 else 1.75e-3)
+
+    async def wait_slot(self) -> None:
+        """Wait until the inter-frame gap after the previous transaction is over"""
+        delay: float = self._next_free - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> "BusScheduler":
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        await self._lock.acquire()
+        try:
+            await self.wait_slot()
+        except BaseException:
+            self._lock.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._next_free = asyncio.get_running_loop().time() + self.gap
+        if self._lock is not None:
+            self._lock.release()
+
+
+class RS485ClientBase(ABC, Generic[ResponseT]):
+    """
+    RS-485 Client base class.
+    Subclasses implement _parse_response for the protocol of the device.
+    """
+
+    __slots__ = (
+        "con_params",
+        "address",
+        "retries",
+        "label",
+        "logger",
+        "_bus_lock",
+    )
+
+    response_delay: float = 5e-3  # seconds between request and response read
 
     def __init__(
         self,
@@ -111,73 +228,34 @@ class RS485Client:
         )
         self.address: int = address
         self.retries: int = retries
-        self.response_delay: float = 5e-3
         self.label: str = label
         self.logger = get_logger(
             self.label, int(kwargs.pop("log_level")) if "log_level" in kwargs else None
         )
+        # Devices sharing one bus must share the lock to serialize transactions
+        self._bus_lock: Union[asyncio.Lock, BusScheduler, None] = kwargs.pop(
+            "bus_lock", None
+        )
+
+    @property
+    def bus_lock(self) -> Union[asyncio.Lock, BusScheduler]:
+        """Lock held for the duration of a bus transaction"""
+        if self._bus_lock is None:
+            self._bus_lock = asyncio.Lock()
+        return self._bus_lock
 
-    def _parse_response(self, response: bytes) -> dict:
+    @abstractmethod
+    def _parse_response(self, response: bytes) -> ResponseT:
         """Response parser"""
-        self.logger.debug("Parsing response: %s", response.hex())
-        parsed: dict = {
-            "crc": 0,
-            "addr": -1,  # 0 is reserved for MODBUS as a broadcast address
-            "cmd": 0,
-            "data_length": 0,
-            "register": 0,
-            "count": 0,
-            "data": tuple(),
-        }
-        if not response:
-            self.logger.debug("Empty response")
-            return parsed
-        parsed["crc"] = response[-1]
-        parsed["addr"] = response[0]
-        parsed["cmd"] = response[1]
-        if parsed["cmd"] == 3:
-            parsed["data_length"] = response[2]
-            parsed["count"] = int(parsed["data_length"] / 2)
-            parsed["data"] = struct.unpack(">" + "h" * parsed["count"], response[3:-1])
-            self.logger.debug(
-                "CMD: %d, ADDR: %d, LEN: %d, DATA: %s, CRC: %s",
-                parsed["cmd"],
-                parsed["addr"],
-                parsed["count"],
-                parsed["data"],
-                parsed["crc"],
-            )
-        elif parsed["cmd"] == 6:
-            parsed["data_length"] = 2
-            parsed["count"] = 1
-            parsed["register"] = struct.unpack(
-                ">" + "h" * parsed["count"], response[2:4]
-            )[0]
-            parsed["data"] = struct.unpack(">" + "h" * parsed["count"], response[4:6])
-            self.logger.debug(
-                "CMD: %d, ADDR: %d, REG: %s, DATA: %s, CRC: %s",
-                parsed["cmd"],
-                parsed["addr"],
-                parsed["register"],
-                parsed["data"],
-                parsed["crc"],
-            )
-        elif parsed["cmd"] >= 0x80:
-            # Error response
-            parsed["data_length"] = 2
-            parsed["count"] = 1
-            parsed["data"] = struct.unpack(">h", response[2:4])
-            self.logger.debug(
-                "ERR: %x, CMD: %x, DATA: %s, CRC: %s",
-                parsed["cmd"],
-                parsed["cmd"] - 0x80,
-                parsed["data"],
-                parsed["crc"],
-            )
-        return parsed
 
-    def _get_payload(self, response: Union[ModbusResponse, None]) -> bytes:
-        """Get the payload from the response"""
+    def _get_payload(
+        self, response: Union[ModbusResponse, None], keep_exception: bool = False
+    ) -> bytes:
+        """
+        Get the payload from the response.
+        Error responses give an empty payload, so the request is retried,
+        unless keep_exception is set and the response is a MODBUS exception.
+        """
         if response:
             if not response.isError():
                 # skip start and stop bytes and parse as a hex string
@@ -188,6 +266,17 @@ class RS485Client:
                 )
                 return payload
             self.logger.debug("Modbus Response Error %s", response.function_code)
+            if keep_exception and isinstance(response, ExceptionResponse):
+                # keep the exception code visible to the parser
+                return (
+                    struct.pack(
+                        ">BBB",
+                        response.slave_id,
+                        response.function_code,
+                        response.exception_code,
+                    )
+                    + b"\x00\x00"
+                )
         return b""
 
     async def read_registers(self, start_register: int = 0, count: int = 1) -> bytes:
@@ -195,13 +284,14 @@ class RS485Client:
         Read registers data using pymodbus.
         Redefine this method for serial or custom protocol.
         """
-        response: Union[ModbusResponse, None] = await modbus_read_registers(
-            self.con_params,
-            start_register=start_register,
-            count=count,
-            slave=self.address,
-            logger=self.logger,
-        )
+        async with self.bus_lock:
+            response: Union[ModbusResponse, None] = await modbus_read_registers(
+                self.con_params,
+                start_register=start_register,
+                count=count,
+                slave=self.address,
+                logger=self.logger,
+            )
         return self._get_payload(response)
 
     async def write_register(self, register: int, value: int) -> bytes:
@@ -209,18 +299,39 @@ class RS485Client:
         Write the data value to the register using pymodbus.
         Redefine this method for serial or custom protocol.
         """
-        response: Union[ModbusResponse, None] = await modbus_write_register(
-            self.con_params,
-            register=register,
-            value=value,
-            slave=self.address,
-            logger=self.logger,
-        )
+        async with self.bus_lock:
+            response: Union[ModbusResponse, None] = await modbus_write_register(
+                self.con_params,
+                register=register,
+                value=value,
+                slave=self.address,
+                logger=self.logger,
+            )
         return self._get_payload(response)
 
+    async def read_write_registers(
+        self, read_register: int, count: int, write_register: int, values: list[int]
+    ) -> bytes:
+        """
+        Write values and read registers data in one transaction using pymodbus.
+        Redefine this method for serial or custom protocol.
+        """
+        async with self.bus_lock:
+            response: Union[ModbusResponse, None] = await modbus_read_write_registers(
+                self.con_params,
+                read_register=read_register,
+                count=count,
+                write_register=write_register,
+                values=values,
+                slave=self.address,
+                logger=self.logger,
+            )
+        # Caller needs the exception code to tell unsupported 0x17 from a failure
+        return self._get_payload(response, keep_exception=True)
+
     async def read_parse_registers(
         self, start_register: int = 0, count: int = 1
-    ) -> dict:
+    ) -> ResponseT:
         """Read registers and return parsed response"""
         for iteration in range(self.retries):
             self.logger.debug("Iteration %d of %d", iteration + 1, self.retries)
@@ -228,43 +339,118 @@ class RS485Client:
                 start_register=start_register, count=count
             )
             parsed = self._parse_response(response)
-            if parsed["addr"] == self.address:
+            if parsed.addr == self.address:
                 return parsed
         return self._parse_response(b"")
 
-    async def write_parse_register(self, register: int, data: int = 0) -> dict:
+    async def write_parse_register(self, register: int, data: int = 0) -> ResponseT:
         """Write the data value to the register and return parsed response"""
         for iteration in range(self.retries):
             self.logger.debug("Iteration %d of %d", iteration + 1, self.retries)
             response = await self.write_register(register=register, value=data)
             parsed = self._parse_response(response)
-            if parsed["addr"] == self.address:
+            if parsed.addr == self.address:
+                return parsed
+        return self._parse_response(b"")
+
+    async def read_write_parse_registers(
+        self, read_register: int, count: int, write_register: int, values: list[int]
+    ) -> ResponseT:
+        """Write values, read registers and return parsed response"""
+        for iteration in range(self.retries):
+            self.logger.debug("Iteration %d of %d", iteration + 1, self.retries)
+            response = await self.read_write_registers(
+                read_register, count, write_register, values
+            )
+            parsed = self._parse_response(response)
+            if parsed.addr == self.address:
                 return parsed
         return self._parse_response(b"")
 
+
+class RS485Client(RS485ClientBase[ParsedResponse]):
+    """RS-485 MODBUS Client class"""
+
+    __slots__ = ()
+
+    def _parse_response(self, response: bytes) -> ParsedResponse:
+        """Response parser"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Parsing response: %s", response.hex())
+        if not response:
+            self.logger.debug("Empty response")
+            return _EMPTY_RESPONSE
+        crc: int = response[-1]
+        addr: int = response[0]
+        cmd: int = response[1]
+        if cmd in (3, 0x17):
+            data_length: int = response[2]
+            count: int = data_length // 2
+            data: tuple[int, ...] = struct.unpack(">" + "h" * count, response[3:-1])
+            self.logger.debug(
+                "CMD: %d, ADDR: %d, LEN: %d, DATA: %s, CRC: %s",
+                cmd,
+                addr,
+                count,
+                data,
+                crc,
+            )
+            return ParsedResponse(crc, addr, cmd, data_length, 0, count, data)
+        if cmd == 6:
+            register: int = struct.unpack(">h", response[2:4])[0]
+            data = struct.unpack(">h", response[4:6])
+            self.logger.debug(
+                "CMD: %d, ADDR: %d, REG: %s, DATA: %s, CRC: %s",
+                cmd,
+                addr,
+                register,
+                data,
+                crc,
+            )
+            return ParsedResponse(crc, addr, cmd, 2, register, 1, data)
+        if cmd >= 0x80:
+            # Error response carries no register data, only the exception code
+            exception_code: int = response[2]
+            self.logger.debug(
+                "ERR: %x, CMD: %x, EXC: %d, CRC: %s",
+                cmd,
+                cmd - 0x80,
+                exception_code,
+                crc,
+            )
+            return ParsedResponse(crc, addr, cmd, exception_code=exception_code)
+        return ParsedResponse(crc, addr, cmd)
+
     async def read_single_register_float(
         self, register: int, factor: int = 100
     ) -> float:
         """Parse a float number from the register data value divided by provided factor"""
-        response: dict = await self.read_parse_registers(register, 1)
-        if response["data"]:
-            return float(response["data"][0] / factor)
+        response: ParsedResponse = await self.read_parse_registers(register, 1)
+        if response.data:
+            return float(response.data[0] / factor)
         return 0.0
 
+    async def read_single_register_uint16(self, register: int) -> int:
+        """Read the register data value as an unsigned 16-bit integer"""
+        response: ParsedResponse = await self.read_parse_registers(register, 1)
+        if response.data:
+            return response.data[0] & 0xFFFF
+        return 0
+
     async def write_single_register_float(
         self, register: int, value: float, factor: int = 100
     ) -> float:
         """Write a float number to the register multiplied by the provided factor"""
         response = await self.write_parse_register(register, int(round(value * factor)))
-        if response["cmd"] == 6 and response["data"]:
-            return float(response["data"][0] / factor)
+        if response.cmd == 6 and response.data:
+            return float(response.data[0] / factor)
         return await self.read_single_register_float(register, factor)
 
     async def read_two_registers_data(
         self, start_register: int, factor: int = 100
     ) -> float:
         """Parse a float number from the data split between two registers"""
-        response: dict = await self.read_parse_registers(start_register, 2)
-        if response["data"]:
-            return float(((response["data"][0] << 16) + response["data"][1]) / factor)
+        response: ParsedResponse = await self.read_parse_registers(start_register, 2)
+        if response.data:
+            return float(((response.data[0] << 16) + response.data[1]) / factor)
         return 0.0
@@ -1,16 +1,28 @@
 """RS485 communication helper functions"""
 
 
-def check_sum(payload: bytes) -> int:
-    """Calculate payload data checksum"""
-    cs = 0xFFFF
-    for data_byte in payload:
-        cs ^= data_byte
+def _crc16_table() -> tuple[int, ...]:
+    """CRC-16/MODBUS (reflected polynomial 0xA001) lookup table"""
+    table: list[int] = []
+    for byte in range(256):
+        cs = byte
         for _ in range(8):
             if cs & 0x0001:
                 cs = (cs >> 1) ^ 0xA001
             else:
                 cs = cs >> 1
+        table.append(cs)
+    return tuple(table)
+
+
+_CRC16_TABLE: tuple[int, ...] = _crc16_table()
+
+
+def check_sum(payload: bytes) -> int:
+    """Calculate payload data checksum"""
+    cs = 0xFFFF
+    for data_byte in payload:
+        cs = (cs >> 8) ^ _CRC16_TABLE[(cs ^ data_byte) & 0xFF]
     return cs
 
 
@@ -217,10 +217,19 @@ _apg_l_v = np.array(
 )
 
 
+# Calibration tables (voltage, pressure) of the supported gauge models
+_calibration_tables: dict[str, tuple[np.ndarray, np.ndarray]] = {
+    "APG-M": (_apg_m_v, _apg_m_p),
+    "APG-MP": (_apg_m_v, _apg_m_p),
+    "APG-L": (_apg_l_v, _apg_l_p),
+}
+
+
 def voltage_to_pressure(voltage: float, model: str = "Edwards") -> float:
     """Analog output voltage to pressure (mbar) conversion"""
-    if model.strip().upper() in ["APG-M", "APG-MP"]:
-        return float(np.interp(voltage, _apg_m_v, _apg_m_p))
-    if model.strip().upper() in ["APG-L"]:
-        return float(np.interp(voltage, _apg_l_v, _apg_l_p))
-    return 0.0
+    table = _calibration_tables.get(model)
+    if table is None:
+        table = _calibration_tables.get(model.strip().upper())
+        if table is None:
+            return 0.0
+    return float(np.interp(voltage, *table))
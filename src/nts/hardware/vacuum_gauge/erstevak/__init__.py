@@ -2,8 +2,12 @@
 Erstevak vacuum gauges. Tested with MTM9D and MTP4D models.
 """
 
+from typing import Union
 from enum import Enum
-from .rs485 import ErstevakRS485
+import math
+import numpy as np
+
+from .rs485 import ErstevakRS485, gather_pressures
 
 
 class CalibrationFactorPirani(Enum):
@@ -39,10 +43,44 @@ class CalibrationFactorPenning(Enum):
 ########################################
 
 
+# Analog output is logarithmic: log10(p) = (U - offset) / scale
+_analog_output_models: dict[str, tuple[float, float]] = {
+    "MTP4D": (5.5, 1.0),
+    "MTM9D": (6.8, 0.6),
+}
+
+
+def _get_analog_output(model: str) -> Union[tuple[float, float], None]:
+    analog_output = _analog_output_models.get(model)
+    if analog_output is None:
+        analog_output = _analog_output_models.get(model.strip().upper())
+    return analog_output
+
+
 def voltage_to_pressure(voltage: float, model: str = "MTP4D") -> float:
     """Analog output voltage to pressure (mbar) conversion"""
-    if model.strip().upper() in ["MTP4D"]:
-        return 10 ** (voltage - 5.5)
-    if model.strip().upper() in ["MTM9D"]:
-        return 10 ** ((voltage - 6.8) / 0.6)
-    return 0.0
+    analog_output = _get_analog_output(model)
+    if analog_output is None:
+        return 0.0
+    offset, scale = analog_output
+    return 10.0 ** ((voltage - offset) / scale)
+
+
+def voltage_to_pressure_array(
+    voltage: np.ndarray, model: str = "MTP4D", out: Union[np.ndarray, None] = None
+) -> np.ndarray:
+    """
+    Analog output voltage to pressure (mbar) conversion for an array of samples.
+    Provide preallocated float64 out array to convert ADC buffers in place.
+    """
+    voltage = np.asarray(voltage, dtype=np.float64)
+    if out is None:
+        out = np.empty_like(voltage)
+    analog_output = _get_analog_output(model)
+    if analog_output is None:
+        out.fill(0.0)
+        return out
+    offset, scale = analog_output
+    np.subtract(voltage, offset, out=out)
+    np.multiply(out, math.log(10.0) / scale, out=out)
+    return np.exp(out, out=out)
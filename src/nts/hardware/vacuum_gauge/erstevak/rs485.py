@@ -3,14 +3,14 @@ Erstevak analog output voltage to pressure conversion as well as RS-485 communic
 Tested with MTM9D and MTP4D models.
 """
 
-from typing import Union
+from typing import Callable, Iterable, Union
 import asyncio
+import math
+from functools import lru_cache
 from enum import Enum
-from decimal import Decimal
 from serial import Serial  # type: ignore
 
-from ...rs485 import SerialConnectionConfig, RS485Client
-
+from ...rs485 import SerialConnectionConfig, RS485ClientBase
 
 #####################################################
 # RS-485 communication                              #
@@ -18,58 +18,87 @@ from ...rs485 import SerialConnectionConfig, RS485Client
 #####################################################
 
 
+_CR: bytes = b"\r"
+_COMMANDS: frozenset[str] = frozenset(
+    ("T", "M", "S", "s", "C", "c", "j", "I", "i", "W", "w")
+)
+# Response frame is 3-byte address + command + data + checksum + CR.
+# Pressure data is always 6 digits, so the frame length is known in advance.
+_RESPONSE_SIZE: dict[str, int] = {"M": 12}
+# Penning state (i) and penning-pirani sync (w) registers take only OFF/ON data
+_BOOL_DATA: dict[int, tuple[str, str]] = {11: ("0", "1"), 13: ("000000", "000001")}
+
+
 def _checksum(msg: bytes) -> int:
     """Calculate checksum for the message"""
-    return sum(list(msg)) % 64 + 64
+    return (sum(msg) & 63) + 64
+
 
+def _frame_checksum(frame: bytes) -> int:
+    """Calculate checksum for the received frame excluding its trailing checksum byte"""
+    return ((sum(frame) - frame[-1]) & 63) + 64
 
+
+@lru_cache(maxsize=64)
 def _build_message(cmd: str, data: str = "", address=2) -> bytes:
-    """Prepare RS-485 message"""
-    addr: bytes = f"{address:03d}".encode(encoding="utf-8", errors="strict")
-    payload: bytes = str(data).encode(encoding="utf-8", errors="strict")
+    """
+    Prepare RS-485 message.
+    Messages are cached as polling sends the same few frames over and over.
+    """
+    payload: bytes = str(data).encode(encoding="ascii", errors="strict")
     if len(payload) > 6:
         raise ValueError("Data can not exceed 6 bytes")
-    if cmd not in ("T", "M", "S", "s", "C", "c", "j", "I", "i", "W", "w"):
+    if cmd not in _COMMANDS:
         raise ValueError("Wrong command")
-    cmd_b: bytes = cmd.encode(encoding="utf-8", errors="strict")
-    msg = addr + cmd_b + payload
-    cs: bytes = chr(_checksum(msg)).encode(encoding="utf-8", errors="strict")
-    return msg + cs + "\r".encode(encoding="utf-8", errors="strict")
-
-
-def f_exp(number):
-    """Get exponent of a number"""
-    (_, digits, exponent) = Decimal(number).as_tuple()
-    return len(digits) + exponent - 1
+    msg: bytes = f"{address:03d}{cmd}".encode(encoding="ascii") + payload
+    return msg + bytes((_checksum(msg),)) + _CR
 
 
-def f_man(number):
-    """Get mantissa of a number"""
-    return Decimal(number).scaleb(-f_exp(number)).normalize()
+def _read_response(con: Serial, command: str) -> bytes:
+    """Read the response frame for the command and strip the CR terminator"""
+    size: Union[int, None] = _RESPONSE_SIZE.get(command)
+    if size is None:
+        return con.read_until(_CR)[:-1]
+    response: bytes = con.read(size)
+    if response[-1:] != _CR:
+        return b""
+    return response[:-1]
 
 
 def _pressure_to_data(pressure: float) -> int:
     """Convert pressure (in mbar) to data string"""
-    base = int(f_man(pressure) * 1000)
-    exp = int(f_exp(pressure) + 20)
-    return int(f"{base:04d}{exp}")
+    if pressure <= 0:
+        return 20  # zero mantissa, "000020"
+    exp: int = math.floor(math.log10(pressure))
+    base: int = round(pressure * 10 ** (3 - exp))
+    if base >= 10000:  # mantissa rounded up to the next decade
+        base //= 10
+        exp += 1
+    return int(f"{base:04d}{exp + 20:02d}")
 
 
-def _parse_pressure(data: str) -> float:
-    """Parse pressure (in mbar) from response data"""
-    try:
-        base: int = int(data[:4])
-        exp: int = int(data[-2:]) - 23
-        return float(base * 10**exp)
-    except TypeError:
+# Pressure exponent is transmitted with an offset of 23
+_POW10: tuple[float, ...] = tuple(10.0**e for e in range(-23, 77))
+
+
+def _parse_pressure(data: bytes) -> float:
+    """Parse pressure (in mbar) from response data, four digits base and two digits exponent"""
+    if len(data) != 6 or not data.isdigit():
         return 0.0
+    base: int = (
+        (data[0] - 48) * 1000
+        + (data[1] - 48) * 100
+        + (data[2] - 48) * 10
+        + (data[3] - 48)
+    )
+    return base * _POW10[(data[4] - 48) * 10 + data[5] - 48]
 
 
 def _calibration_to_data(cal: float) -> int:
     return int(round(cal * 100))
 
 
-def _parse_calibration(data: str) -> float:
+def _parse_calibration(data: bytes) -> float:
     try:
         cal: float = int(data) / 100
         return cal
@@ -77,7 +106,80 @@ def _parse_calibration(data: str) -> float:
         return 0.0
 
 
-class ErstevakRS485(RS485Client):
+class GaugeResponse:
+    """Parsed gauge response"""
+
+    # pylint: disable=too-many-instance-attributes,too-few-public-methods
+
+    __slots__ = (
+        "addr",
+        "cmd",
+        "data",
+        "crc",
+        "pressure",
+        "setpoint",
+        "calibration",
+        "gauge_model",
+        "penning_enabled",
+        "penning_sync",
+    )
+
+    def __init__(self) -> None:
+        self.addr: Union[int, None] = None
+        self.cmd: Union[str, None] = None
+        self.data: Union[bytes, None] = None
+        self.crc: Union[int, None] = None
+        self.pressure: Union[float, None] = None
+        self.setpoint: Union[float, None] = None
+        self.calibration: Union[float, None] = None
+        self.gauge_model: Union[str, None] = None
+        self.penning_enabled: Union[bool, None] = None
+        self.penning_sync: Union[bool, None] = None
+
+
+def _parse_gauge_model(result: GaugeResponse, data: bytes) -> None:
+    result.gauge_model = data.decode(encoding="ascii")
+
+
+def _parse_pressure_data(result: GaugeResponse, data: bytes) -> None:
+    if len(data) > 1:
+        result.pressure = _parse_pressure(data)
+
+
+def _parse_setpoint_data(result: GaugeResponse, data: bytes) -> None:
+    if len(data) > 1:
+        result.setpoint = _parse_pressure(data)
+
+
+def _parse_calibration_data(result: GaugeResponse, data: bytes) -> None:
+    if len(data) > 1:
+        result.calibration = _parse_calibration(data)
+
+
+def _parse_penning_enabled(result: GaugeResponse, data: bytes) -> None:
+    result.penning_enabled = bool(int(data))
+
+
+def _parse_penning_sync(result: GaugeResponse, data: bytes) -> None:
+    result.penning_sync = bool(int(data))
+
+
+_RESPONSE_HANDLERS: dict[str, Callable[[GaugeResponse, bytes], None]] = {
+    "T": _parse_gauge_model,
+    "M": _parse_pressure_data,
+    "S": _parse_setpoint_data,
+    "s": _parse_setpoint_data,
+    "C": _parse_calibration_data,
+    "c": _parse_calibration_data,
+    "j": _parse_pressure_data,
+    "I": _parse_penning_enabled,
+    "i": _parse_penning_enabled,
+    "W": _parse_penning_sync,
+    "w": _parse_penning_sync,
+}
+
+
+class ErstevakRS485(RS485ClientBase[GaugeResponse]):
     """Erstevak gauge RS-485 communication"""
 
     def __init__(
@@ -112,56 +214,30 @@ class ErstevakRS485(RS485Client):
             12: "W",
             13: "w",
         }
+        self._low_latency: bool = True
+        # Read commands take no data, so their frames are built once per address
+        self._prebuilt: dict[str, bytes] = {}
+        self._prebuilt_address: int = -1
 
-    def _parse_response(self, response: bytes) -> dict:
+    def _parse_response(self, response: bytes) -> GaugeResponse:
         """Parse gauge response"""
-        # pylint: disable=too-many-branches
-
-        result: dict = {
-            "addr": None,
-            "cmd": None,
-            "data": None,
-            "crc": None,
-            "pressure": None,
-            "setpoint": None,
-            "calibration": None,
-            "gauge_model": None,
-            "penning_enabled": None,
-            "penning_sync": None,
-        }
+        result: GaugeResponse = GaugeResponse()
         self.logger.debug("Parsing response %s", response)
         if response:
-            cs: int = _checksum(response[:-1])
+            cs: int = _frame_checksum(response)
             self.logger.debug("CS calc: %s, CS: %s", cs, response[-1])
             if cs == response[-1]:
-                response_data: str = response.decode()[:-1]
-                r_address: int = int(response_data[:3])
+                r_address: int = int(response[:3])
                 if self.address == r_address:
-                    result["addr"] = self.address
-                    result["cmd"] = response_data[3]
-                    result["data"] = response_data[4:]
-                    result["crc"] = cs
-                    if result["cmd"] == "T":
-                        result["gauge_model"] = result["data"]
-                    elif result["cmd"] == "M":
-                        p = _parse_pressure(result["data"])
-                        result["pressure"] = p
-                    elif result["cmd"] in ("S", "s"):
-                        if len(result["data"]) > 1:
-                            p = _parse_pressure(result["data"])
-                            result["setpoint"] = p
-                    elif result["cmd"] in ("C", "c"):
-                        if len(result["data"]) > 1:
-                            cal = _parse_calibration(result["data"])
-                            result["calibration"] = cal
-                    elif result["cmd"] == "j":
-                        if len(result["data"]) > 1:
-                            p = _parse_pressure(result["data"])
-                            result["pressure"] = p
-                    elif result["cmd"] in ("I", "i"):
-                        result["penning_enabled"] = bool(int(result["data"]))
-                    elif result["cmd"] in ("W", "w"):
-                        result["penning_sync"] = bool(int(result["data"]))
+                    cmd: str = chr(response[3])
+                    data: bytes = response[4:-1]
+                    result.addr = self.address
+                    result.cmd = cmd
+                    result.data = data
+                    result.crc = cs
+                    handler = _RESPONSE_HANDLERS.get(cmd)
+                    if handler is not None:
+                        handler(result, data)
                 else:
                     self.logger.error("Wrong address")
                     return result
@@ -170,121 +246,164 @@ class ErstevakRS485(RS485Client):
                 return result
         return result
 
+    def _connect(self) -> Serial:
+        """
+        Open the serial port.
+        USB-serial adapters buffer input for several milliseconds by default,
+        which dominates the round trip, so low latency mode is requested
+        where the driver supports it.
+        """
+        con: Serial = Serial(**self.con_params.model_dump())
+        if self._low_latency:
+            try:
+                con.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+                self.logger.debug("Low latency mode is not available: %s", e)
+                self._low_latency = False
+        return con
+
+    async def _wait_response(self, con: Serial) -> None:
+        """
+        Wait until the response starts to arrive rather than for a fixed delay.
+        Fall back to sleeping for response_delay if the port can not be polled.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        def _readable() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        try:
+            fd: int = con.fileno()
+            loop.add_reader(fd, _readable)
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            await asyncio.sleep(self.response_delay)
+            return
+        try:
+            await asyncio.wait_for(future, timeout=self.response_delay * 3)
+        except asyncio.TimeoutError:
+            self.logger.debug("No response within %g s", self.response_delay * 3)
+        finally:
+            loop.remove_reader(fd)
+
+    async def _transaction(self, command: str, msg: bytes) -> bytes:
+        """Send the message to the gauge and read the response"""
+        self.logger.debug("RS485 MSG: %s", msg)
+        async with self.bus_lock:
+            con: Serial = self._connect()
+            con.write(msg)
+            await self._wait_response(con)
+            response: bytes = _read_response(con, command)
+            con.close()
+        return response
+
+    def _read_message(self, command: str) -> bytes:
+        """Prebuilt message for the read command"""
+        if self._prebuilt_address != self.address:
+            self._prebuilt = {
+                cmd: _build_message(cmd, "", self.address)
+                for cmd in ("T", "M", "I", "W")
+            }
+            self._prebuilt_address = self.address
+        return self._prebuilt[command]
+
     async def read_registers(self, start_register: int = 0, count: int = 1) -> bytes:
         """Send command to gauge and read data"""
-        con: Serial
         if start_register not in (0, 1, 10, 12):
             return b""
         command = self._registers[start_register]
-        msg: bytes = _build_message(command, "", self.address)
-        self.logger.debug("RS485 MSG: %s", msg)
-        con = Serial(**self.con_params.model_dump())
-        con.write(msg)
-        await asyncio.sleep(self.response_delay)
-        response: bytes = con.read_until(b"\r")[:-1]
-        con.close()
-        return response
+        return await self._transaction(command, self._read_message(command))
 
     async def write_register(self, register: int, value: int) -> bytes:
         """Write the data value to the register"""
-        con: Serial
         data: str
         if register in (0, 1, 10, 12):
             return b""
         command = self._registers[register]
-        if register in (4, 7, 9, 13):
+        bool_data: Union[tuple[str, str], None] = _BOOL_DATA.get(register)
+        if bool_data is not None:
+            data = bool_data[bool(value)]
+        elif register in (4, 7, 9):
             data = f"{int(value):06d}"
         else:
             data = f"{int(value)}"
-        msg: bytes = _build_message(command, data, self.address)
-        self.logger.debug("RS485 MSG: %s", msg)
-        con = Serial(**self.con_params.model_dump())
-        con.write(msg)
-        await asyncio.sleep(self.response_delay)
-        response: bytes = con.read_until(b"\r")[:-1]
-        con.close()
-        return response
+        return await self._transaction(
+            command, _build_message(command, data, self.address)
+        )
 
     async def get_gauge_type(self) -> str:
         """Get gauge model"""
-        data = await self.read_parse_registers(0)
-        if data["cmd"] == "T":
-            return data["gauge_model"]
+        data: GaugeResponse = await self.read_parse_registers(0)
+        if data.cmd == "T" and data.gauge_model is not None:
+            return data.gauge_model
         return ""
 
     async def get_pressure(self) -> float:
         """Get pressure measurement"""
-        data = await self.read_parse_registers(1)
-        if data["cmd"] == "M":
-            return data["pressure"]
+        data: GaugeResponse = await self.read_parse_registers(1)
+        if data.cmd == "M" and data.pressure is not None:
+            return data.pressure
         return 0.0
 
     async def get_setpoint(self, sp: int = 1) -> float:
         """Get setpoint pressure"""
-        data = await self.write_parse_register(2, sp)
-        if data["cmd"] == "S":
-            return data["setpoint"]
+        data: GaugeResponse = await self.write_parse_register(2, sp)
+        if data.cmd == "S" and data.setpoint is not None:
+            return data.setpoint
         return 0.0
 
+    async def _unlock_write(
+        self, unlock_register: int, key: int, register: int, value: int
+    ) -> Union[GaugeResponse, None]:
+        """
+        Unlock the register with the key and write the value to it.
+        Return the parsed write response or None if any of the steps failed.
+        """
+        command: str = self._registers[unlock_register]
+        data: GaugeResponse = await self.write_parse_register(unlock_register, key)
+        if data.cmd == command and data.data == b"%d" % key:  # unlocked
+            data = await self.write_parse_register(register, value)
+            if data.cmd == command:
+                return data
+        return None
+
     async def set_setpoint(self, pressure: float, sp: int = 1) -> float:
         """Set setpoint pressure"""
-        # unlock setpoint register
-        data = await self.write_parse_register(3, sp)
-        if data["cmd"] == "s":
-            if data["data"] == f"{sp}":  # unlocked
-                # write setpoint value to register
-                data = await self.write_parse_register(4, _pressure_to_data(pressure))
-                if data["cmd"] == "s" and data["setpoint"]:
-                    return data["setpoint"]
+        data = await self._unlock_write(3, sp, 4, _pressure_to_data(pressure))
+        if data is not None and data.setpoint:
+            return data.setpoint
         # if failed try to read setpoint value from register
         return await self.get_setpoint(sp)
 
     async def get_calibration(self, cal_n: int = 1) -> float:
         """Get calibration coefficient"""
-        data = await self.write_parse_register(5, cal_n)
-        if data["cmd"] == "C":
-            return data["calibration"]
+        data: GaugeResponse = await self.write_parse_register(5, cal_n)
+        if data.cmd == "C" and data.calibration is not None:
+            return data.calibration
         return 0.0
 
     async def set_calibration(self, cal: Union[float, Enum], cal_n: int = 1) -> float:
         """Set calibration coefficient"""
-        # unlock calibration register
-        data = await self.write_parse_register(6, cal_n)
-        if data["cmd"] == "c":
-            if data["data"] == f"{cal_n}":  # unlocked
-                # write calibration value to register
-                if isinstance(cal, Enum):
-                    cal_f = cal.value
-                else:
-                    cal_f = float(cal)
-                data = await self.write_parse_register(7, _calibration_to_data(cal_f))
-                if data["cmd"] == "c" and data["calibration"]:
-                    return data["calibration"]
+        cal_f: float = cal.value if isinstance(cal, Enum) else float(cal)
+        data = await self._unlock_write(6, cal_n, 7, _calibration_to_data(cal_f))
+        if data is not None and data.calibration:
+            return data.calibration
         # if failed try to read calibration value from register
         return await self.get_calibration(cal_n)
 
     async def set_atmosphere(self) -> float:
         """Calibrate atmospheric pressure"""
-        # unlock register
-        data = await self.write_parse_register(8, 1)
-        if data["cmd"] == "j":
-            if data["data"] == "1":  # unlocked
-                # write value to register
-                data = await self.write_parse_register(9, _pressure_to_data(1000.0))
-                if data["cmd"] == "j" and data["pressure"]:
-                    return data["pressure"]
+        data = await self._unlock_write(8, 1, 9, _pressure_to_data(1000.0))
+        if data is not None and data.pressure:
+            return data.pressure
         return 0.0
 
     async def set_zero(self) -> float:
         """Calibrate zero pressure"""
-        # unlock register
-        data = await self.write_parse_register(8, 0)
-        if data["cmd"] == "j":
-            if data["data"] == "0":  # unlocked
-                # write value to register
-                data = await self.write_parse_register(9, 0)
-                if data["cmd"] == "j" and data["pressure"]:
-                    return data["pressure"]
+        data = await self._unlock_write(8, 0, 9, 0)
+        if data is not None and data.pressure:
+            return data.pressure
         return 0.0
 
     async def get_penning_state(self) -> bool:
@@ -292,16 +411,16 @@ class ErstevakRS485(RS485Client):
         Read the ON/OFF state of the penning gauge.
         Return True if penning is ON, False otherwise.
         """
-        data = await self.read_parse_registers(7)
-        if data["cmd"] == "I" and data["penning_enabled"] is not None:
-            return data["penning_enabled"]
+        data: GaugeResponse = await self.read_parse_registers(10)
+        if data.cmd == "I" and data.penning_enabled is not None:
+            return data.penning_enabled
         return False
 
     async def set_penning_state(self, enable: bool = True) -> float:
         """Set penning gauge to ON/OFF"""
-        data = await self.write_parse_register(11, int(bool(enable)))
-        if data["cmd"] == "i" and data["penning_enabled"] is not None:
-            return data["penning_enabled"]
+        data: GaugeResponse = await self.write_parse_register(11, int(bool(enable)))
+        if data.cmd == "i" and data.penning_enabled is not None:
+            return data.penning_enabled
         return await self.get_penning_state()
 
     async def get_penning_sync(self) -> bool:
@@ -309,14 +428,22 @@ class ErstevakRS485(RS485Client):
         Read the ON/OFF state of the penning-pirani synchronization.
         Return True if sync is ON, False otherwise.
         """
-        data = await self.read_parse_registers(9)
-        if data["cmd"] == "W" and data["penning_sync"] is not None:
-            return data["penning_sync"]
+        data: GaugeResponse = await self.read_parse_registers(12)
+        if data.cmd == "W" and data.penning_sync is not None:
+            return data.penning_sync
         return False
 
     async def set_penning_sync(self, enable: bool = True) -> float:
         """Set penning-pirani sync to ON/OFF"""
-        data = await self.write_parse_register(13, int(bool(enable)))
-        if data["cmd"] == "w" and data["penning_sync"] is not None:
-            return data["penning_sync"]
+        data: GaugeResponse = await self.write_parse_register(13, int(bool(enable)))
+        if data.cmd == "w" and data.penning_sync is not None:
+            return data.penning_sync
         return await self.get_penning_sync()
+
+
+async def gather_pressures(gauges: Iterable[ErstevakRS485]) -> list[float]:
+    """
+    Poll pressure from several gauges concurrently.
+    Gauges connected to the same bus should be created with a shared bus_lock.
+    """
+    return list(await asyncio.gather(*(gauge.get_pressure() for gauge in gauges)))
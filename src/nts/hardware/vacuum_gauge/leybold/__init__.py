@@ -2,7 +2,9 @@
 Leybold analog output voltage to pressure conversion.
 """
 
+from typing import Callable
 from enum import Enum
+import numpy as np
 
 
 class CalibrationFactorPirani(Enum):
@@ -22,12 +24,46 @@ class CalibrationFactorPirani(Enum):
 ########################################
 
 
+def _ttr101n_pressure(voltage: float) -> float:
+    # Saturates at the limits of the measurement range 5e-5 to 1.5e3 mbar
+    return max(5e-5, min(1.5e3, 10 ** ((voltage - 6.143) / 1.286)))
+
+
+def _ttr101n_pressure_array(voltage: np.ndarray) -> np.ndarray:
+    return np.clip(np.power(10.0, (voltage - 6.143) / 1.286), 5e-5, 1.5e3)
+
+
+_voltage_converters: dict[str, Callable[[float], float]] = {
+    "TTR 101 N THERMOVAC": _ttr101n_pressure,
+    "TTR 101 N": _ttr101n_pressure,
+    "TTR101N": _ttr101n_pressure,
+}
+
+_array_converters: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "TTR 101 N THERMOVAC": _ttr101n_pressure_array,
+    "TTR 101 N": _ttr101n_pressure_array,
+    "TTR101N": _ttr101n_pressure_array,
+}
+
+
 def voltage_to_pressure(voltage: float, model: str = "Leybold") -> float:
     """Analog output voltage to pressure (mbar) conversion"""
-    if model.strip().upper() in ["TTR 101 N THERMOVAC", "TTR 101 N", "TTR101N"]:
-        if voltage < 0.6119:
-            return 5e-5
-        if voltage > 10.2275:
-            return 1.5e3
-        return 10 ** ((voltage - 6.143) / 1.286)
-    return 0.0
+    converter = _voltage_converters.get(model)
+    if converter is None:
+        converter = _voltage_converters.get(model.strip().upper())
+        if converter is None:
+            return 0.0
+    return converter(voltage)
+
+
+def voltage_to_pressure_array(
+    voltage: np.ndarray, model: str = "Leybold"
+) -> np.ndarray:
+    """Analog output voltage to pressure (mbar) conversion for an array of samples"""
+    voltage = np.asarray(voltage, dtype=np.float64)
+    converter = _array_converters.get(model)
+    if converter is None:
+        converter = _array_converters.get(model.strip().upper())
+        if converter is None:
+            return np.zeros_like(voltage)
+    return converter(voltage)
@@ -1,3 +1,4 @@
 """VFD control module"""
 
+from .vfd import VFDPool
 from .intek_spe_b import VFDIntekSPEb
@@ -1,69 +1,75 @@
 """Intek SPE-B VFD RS485 control routines"""
 
-from .vfd import VFD, VFDError, VFDState, VFDParameters
+from .vfd import VFD, VFDState, VFDParameters, _EMPTY_PARAMS
 from ..rs485 import ModbusSerialConnectionConfig
 
 
-intek_spe_b_error_codes = {
+intek_spe_b_error_codes: dict[int, str] = {
     # VFD errors
-    0: VFDError(code=0, message="No error"),
-    1: VFDError(code=1, message="Reserved"),
-    2: VFDError(code=2, message="Current overload during acceleration"),
-    3: VFDError(code=3, message="Current overload during deceleration"),
-    4: VFDError(code=4, message="Current overload at constant speed"),
-    5: VFDError(code=5, message="Voltage overload during acceleration"),
-    6: VFDError(code=6, message="Voltage overload during deceleration"),
-    7: VFDError(code=7, message="Voltage overload at constant speed"),
-    8: VFDError(code=8, message="Control circuits power failure"),
-    9: VFDError(code=9, message="Undervoltage error"),
-    10: VFDError(code=10, message="VFD overload"),
-    11: VFDError(code=11, message="Motor overload"),
-    12: VFDError(code=12, message="Input phase error"),
-    13: VFDError(code=13, message="Output phase error"),
-    14: VFDError(code=14, message="Overheat of power converter"),
-    15: VFDError(code=15, message="External error"),
-    16: VFDError(code=16, message="Remote connection error"),
-    17: VFDError(code=17, message="Internal contactor failure"),
-    18: VFDError(code=18, message="Current sensor failure"),
-    19: VFDError(code=19, message="Automatic motor tuning failure"),
-    21: VFDError(code=21, message="EEPROM IO error"),
-    22: VFDError(code=22, message="VFD hardware error"),
-    23: VFDError(code=23, message="Grounding failure"),
-    24: VFDError(code=24, message="Reserved"),
-    25: VFDError(code=25, message="Reserved"),
-    26: VFDError(code=26, message="Total operation timeout"),
-    27: VFDError(code=27, message="User error 1"),
-    28: VFDError(code=28, message="User error 2"),
-    29: VFDError(code=29, message="Power on timeout"),
-    30: VFDError(code=30, message="Underloaded error"),
-    31: VFDError(code=31, message="PID feedback connection loss"),
-    40: VFDError(code=40, message="IGBT current limiter failure"),
-    41: VFDError(code=41, message="Running motor switch error"),
-    42: VFDError(code=42, message="Speed error"),
-    43: VFDError(code=43, message="Over speed error"),
-    45: VFDError(code=45, message="Motor overheat error"),
-    92: VFDError(code=92, message="Positioning error"),
-    94: VFDError(code=94, message="Calculated speed error"),
+    0: "No error",
+    1: "Reserved",
+    2: "Current overload during acceleration",
+    3: "Current overload during deceleration",
+    4: "Current overload at constant speed",
+    5: "Voltage overload during acceleration",
+    6: "Voltage overload during deceleration",
+    7: "Voltage overload at constant speed",
+    8: "Control circuits power failure",
+    9: "Undervoltage error",
+    10: "VFD overload",
+    11: "Motor overload",
+    12: "Input phase error",
+    13: "Output phase error",
+    14: "Overheat of power converter",
+    15: "External error",
+    16: "Remote connection error",
+    17: "Internal contactor failure",
+    18: "Current sensor failure",
+    19: "Automatic motor tuning failure",
+    21: "EEPROM IO error",
+    22: "VFD hardware error",
+    23: "Grounding failure",
+    24: "Reserved",
+    25: "Reserved",
+    26: "Total operation timeout",
+    27: "User error 1",
+    28: "User error 2",
+    29: "Power on timeout",
+    30: "Underloaded error",
+    31: "PID feedback connection loss",
+    40: "IGBT current limiter failure",
+    41: "Running motor switch error",
+    42: "Speed error",
+    43: "Over speed error",
+    45: "Motor overheat error",
+    92: "Positioning error",
+    94: "Calculated speed error",
 }
 
 
-intek_spe_b_error_codes_com = {
+intek_spe_b_error_codes_com: dict[int, str] = {
     # Communication errors
-    0: VFDError(code=0, message="No error"),
-    1: VFDError(code=1, message="Wrong password"),
-    2: VFDError(code=2, message="Command code error"),
-    3: VFDError(code=3, message="CRC error"),
-    4: VFDError(code=4, message="Invalid address"),
-    5: VFDError(code=5, message="Invalid parameter"),
-    6: VFDError(code=6, message="Parameter can not be edited"),
-    7: VFDError(code=7, message="System is blocked"),
-    8: VFDError(code=8, message="EEPROM write during operation"),
+    0: "No error",
+    1: "Wrong password",
+    2: "Command code error",
+    3: "CRC error",
+    4: "Invalid address",
+    5: "Invalid parameter",
+    6: "Parameter can not be edited",
+    7: "System is blocked",
+    8: "EEPROM write during operation",
 }
 
 
 class VFDIntekSPEb(VFD):
     """Intek SPE-B VFD over pyModbus"""
 
+    __slots__ = ("_read_write_supported", "_read_reg", "_write_reg")
+
+    # Control register commands, start index is (backward << 1) | slow
+    _START_CMDS: tuple[int, int, int, int] = (1, 3, 2, 4)
+    _STOP_CMDS: tuple[int, int] = (6, 5)  # index is freewheel
+
     def __init__(
         self,
         con_params: ModbusSerialConnectionConfig,
@@ -72,8 +78,9 @@ class VFDIntekSPEb(VFD):
         label: str = "VFD",
         **kwargs,
     ):
+        # pylint: disable=R0801
         super().__init__(
-            con_params=ModbusSerialConnectionConfig(**con_params.model_dump()),
+            con_params=con_params,
             address=address,
             retries=retries,
             label=label,
@@ -81,51 +88,65 @@ class VFDIntekSPEb(VFD):
             error_codes_com=intek_spe_b_error_codes_com,
             **kwargs,
         )
+        self._read_write_supported: bool = True
+        # Register accessors bound once for the polling hot path
+        self._read_reg = self.read_single_register_uint16
+        self._write_reg = self.write_parse_register
 
     # Errors processing methods
     async def read_error_code(self) -> int:
         """Read error code from the VFD"""
-        return int(await self.read_single_register_float(0x8000, 1))
+        return await self._read_reg(0x8000)
 
     async def read_error_code_com(self) -> int:
         """Read communication error code from the VFD"""
-        return int(await self.read_single_register_float(0x8001, 1))
+        return await self._read_reg(0x8001)
 
     async def clear_error(self) -> int:
         """Clear error from the VFD"""
-        await self.write_parse_register(0x2000, 7)
+        if self._read_write_supported:
+            # Write the reset command and read the error code in one transaction
+            response = await self.read_write_parse_registers(0x8000, 1, 0x2000, [7])
+            if response.cmd == 0x17 and response.data:
+                return response.data[0] & 0xFFFF
+            if response.cmd == 0x97 and response.exception_code == 1:
+                # Illegal function, the drive does not implement 0x17
+                self.logger.debug("Read/write registers not supported, falling back")
+                self._read_write_supported = False
+            else:
+                self.logger.debug("Read/write registers failed, falling back")
+        await self._write_reg(0x2000, 7)
         return await self.read_error_code()
 
     # Parameters monitoring methods
     async def read_parameters(self) -> VFDParameters:
         """Start the VFD"""
-        data = await self.read_parse_registers(1000, 6)
+        # Monitoring block is read in one transaction and sliced into parameters
+        data = (await self.read_parse_registers(1000, 6)).data
+        if len(data) < 6:
+            return _EMPTY_PARAMS
         return VFDParameters(
-            frequency=data["data"][1], frequency_percent=data["data"][1]
+            frequency=float(data[1]),
+            frequency_percent=float(data[1]),
+            output_current=float(data[3]),
+            output_voltage=float(data[4]),
+            output_power=float(data[5]),
         )
 
     async def read_state(self) -> VFDState:
         """Start the VFD"""
-        state = int(await self.read_single_register_float(0x3000, 1))
-        if state == 1:
-            return VFDState.RUNNING_FORWARD
-        if state == 2:
-            return VFDState.RUNNING_BACKWARD
-        if state == 3:
-            return VFDState.STOPPED
+        state = await self._read_reg(0x3000)
+        if 1 <= state <= 3:
+            return VFDState(state)
         return VFDState.UNKNOWN
 
     # VFD Control methods
     async def start(self, backward: bool = False, slow: bool = False) -> None:
         """Start the VFD"""
-        cmd: int = 1
-        if backward:
-            cmd = 4 if slow else 2
-        elif slow:
-            cmd = 3
-        await self.write_parse_register(0x2000, cmd)
+        cmd: int = self._START_CMDS[(bool(backward) << 1) | bool(slow)]
+        await self._write_reg(0x2000, cmd)
 
     async def stop(self, freewheel: bool = False) -> None:
         """Start the VFD"""
-        cmd: int = 5 if freewheel else 6
-        await self.write_parse_register(0x2000, cmd)
+        cmd: int = self._STOP_CMDS[bool(freewheel)]
+        await self._write_reg(0x2000, cmd)
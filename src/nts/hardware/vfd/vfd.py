@@ -1,31 +1,47 @@
 """Base VFD interfaces"""
 
-from typing import Union
+from typing import Iterable, Mapping, Union
 import asyncio
-from enum import Enum
-from pydantic import BaseModel
+from enum import IntEnum
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
 from ..rs485 import RS485Client, SerialConnectionConfig, ModbusSerialConnectionConfig
 
 
-class VFDState(Enum):
-    """Possible states of the VFD"""
+class VFDState(IntEnum):
+    """Possible states of the VFD, values follow the state register codes"""
 
-    UNKNOWN = "Unknown"
-    STOPPED = "Stopped"
-    RUNNING_FORWARD = "Running forward"
-    RUNNING_BACKWARD = "Running reverse"
+    UNKNOWN = 0
+    RUNNING_FORWARD = 1
+    RUNNING_BACKWARD = 2
+    STOPPED = 3
 
 
-class VFDError(BaseModel):
-    """Model of error code-message"""
+@dataclass(frozen=True)
+class VFDError:
+    """Error code-message"""
 
     code: int
     message: str
 
+    def to_dict(self) -> dict:
+        """Convert to dict, e.g. for JSON serialization"""
+        return asdict(self)
 
-class VFDParameters(BaseModel):
-    """VFD parameters model"""
+
+_DEFAULT_ERRORS: Mapping[int, str] = MappingProxyType({0: "No error"})
+
+
+@lru_cache(maxsize=256)
+def _vfd_error(code: int, message: str) -> VFDError:
+    return VFDError(code=code, message=message)
+
+
+@dataclass(frozen=True)
+class VFDParameters:
+    """VFD parameters"""
 
     frequency: float
     frequency_percent: float
@@ -35,19 +51,28 @@ class VFDParameters(BaseModel):
     started: bool = False
     state: VFDState = VFDState.STOPPED
 
+    def to_dict(self) -> dict:
+        """Convert to dict, e.g. for JSON serialization"""
+        return asdict(self)
+
+
+_EMPTY_PARAMS: VFDParameters = VFDParameters(frequency=0.0, frequency_percent=0.0)
+
 
 class VFD(RS485Client):
     """VFD control base class"""
 
     # pylint: disable=too-many-public-methods
 
+    __slots__ = ("error_codes", "error_codes_com")
+
     def __init__(
         self,
         con_params: Union[SerialConnectionConfig, ModbusSerialConnectionConfig],
         address: int = 1,
         retries: int = 5,
-        error_codes: Union[dict[int, VFDError], None] = None,
-        error_codes_com: Union[dict[int, VFDError], None] = None,
+        error_codes: Union[Mapping[int, str], None] = None,
+        error_codes_com: Union[Mapping[int, str], None] = None,
         label: str = "VFD",
         **kwargs,
     ):
@@ -59,59 +84,69 @@ class VFD(RS485Client):
             label=label,
             **kwargs,
         )
-        self.error_codes: dict[int, VFDError]
-        self.error_codes_com: dict[int, VFDError]
-        if error_codes is None:
-            self.error_codes = {0: VFDError(code=0, message="No error")}
-        if error_codes_com is None:
-            self.error_codes_com = {0: VFDError(code=0, message="No error")}
+        # Error code to message maps, VFDError models are built on lookup
+        self.error_codes: Mapping[int, str] = (
+            _DEFAULT_ERRORS if error_codes is None else error_codes
+        )
+        self.error_codes_com: Mapping[int, str] = (
+            _DEFAULT_ERRORS if error_codes_com is None else error_codes_com
+        )
 
     # Errors processing methods
     async def read_error_code(self) -> int:
         """Read error code from the VFD"""
-        await asyncio.sleep(self.response_delay)
         return 0
 
     async def read_error_code_com(self) -> int:
         """Read communication error code from the VFD"""
-        await asyncio.sleep(self.response_delay)
         return 0
 
     def parse_error_code(self, code: int) -> VFDError:
         """Parse error code from the VFD"""
-        if code in self.error_codes:
-            return self.error_codes[code]
-        return VFDError(code=code, message="Unknown error")
+        return _vfd_error(code, self.error_codes.get(code, "Unknown error"))
 
     def parse_error_code_com(self, code: int) -> VFDError:
         """Parse communication error code from the VFD"""
-        if code in self.error_codes_com:
-            return self.error_codes_com[code]
-        return VFDError(code=code, message="Unknown error")
+        return _vfd_error(code, self.error_codes_com.get(code, "Unknown error"))
 
     async def clear_error(self) -> int:
         """Clear error from the VFD"""
-        await asyncio.sleep(self.response_delay)
         return 0
 
     # Parameters monitoring methods
     async def read_parameters(self) -> VFDParameters:
         """Start the VFD"""
-        await asyncio.sleep(self.response_delay)
-        return VFDParameters(frequency=0.0, frequency_percent=0.0)
+        return _EMPTY_PARAMS
 
     async def read_state(self) -> VFDState:
         """Start the VFD"""
-        await asyncio.sleep(self.response_delay)
         return VFDState.UNKNOWN
 
     # VFD Control methods
     async def start(self, backward: bool = False, slow: bool = False) -> None:
         """Start the VFD"""
         # pylint: disable=unused-argument
-        await asyncio.sleep(self.response_delay)
 
     async def stop(self, freewheel: bool = False) -> None:
         """Start the VFD"""
         # pylint: disable=unused-argument
-        await asyncio.sleep(self.response_delay)
+
+
+class VFDPool:
+    """
+    Group of VFDs polled concurrently.
+    VFDs connected to the same bus should be created with a shared bus_lock.
+    """
+
+    __slots__ = ("vfds",)
+
+    def __init__(self, vfds: Iterable[VFD]):
+        self.vfds: tuple[VFD, ...] = tuple(vfds)
+
+    async def read_all_parameters(self) -> list[VFDParameters]:
+        """Read parameters of all VFDs in the pool"""
+        return list(await asyncio.gather(*(vfd.read_parameters() for vfd in self.vfds)))
+
+    async def read_all_states(self) -> list[VFDState]:
+        """Read states of all VFDs in the pool"""
+        return list(await asyncio.gather(*(vfd.read_state() for vfd in self.vfds)))
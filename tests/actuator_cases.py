@@ -0,0 +1,36 @@
+""" Shared proportional actuator test cases """
+
+import logging
+import numpy as np
+
+# value set, value expected, actuator is on
+VALUE_SET = np.array([1, 0, 0.5, 0.1, 1.1, -1], dtype=np.float64)
+VALUE_EXPECTED = np.clip(VALUE_SET, 0.0, 1.0)
+VALUE_CASES = list(
+    zip(VALUE_SET.tolist(), VALUE_EXPECTED.tolist(), (VALUE_EXPECTED > 0).tolist())
+)
+
+
+def constructor_cases(default_label: str) -> list[tuple[dict, str, bool, int]]:
+    """Constructor kwargs, label, normally off and initial value cases"""
+    return [
+        ({}, default_label, True, 0),
+        (
+            {"label": "MY ACTUATOR", "normally_off": False, "log_level": logging.DEBUG},
+            "MY ACTUATOR",
+            False,
+            1,
+        ),
+        (
+            {"label": "MY ACTUATOR", "normally_on": True, "log_level": logging.DEBUG},
+            "MY ACTUATOR",
+            False,
+            1,
+        ),
+        (
+            {"label": "MY ACTUATOR", "normally_on": False, "log_level": logging.DEBUG},
+            "MY ACTUATOR",
+            True,
+            0,
+        ),
+    ]
@@ -0,0 +1,75 @@
+""" Shared fixtures for the hardware tests """
+
+from unittest.mock import MagicMock
+import pytest
+from gpiozero import Device, OutputDevice, PWMOutputDevice  # type: ignore
+from gpiozero.pins.mock import MockFactory
+
+from nts.hardware.actuator import (
+    GPIOActuator,
+    GPIOProportionalActuator,
+    HWPWMProportionalActuator,
+)
+
+# rpi-hardware-pwm when installed, the package stub otherwise
+from nts.hardware.actuator.proportional_actuator import HardwarePWM
+
+# pylint: disable=redefined-outer-name
+# Fixtures are passed to dependent fixtures by name.
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pin_factory():
+    """Mock pin factory installed once as gpiozero default for the session"""
+    previous_factory = Device.pin_factory
+    Device.pin_factory = MockFactory()
+    yield Device.pin_factory
+    Device.pin_factory = previous_factory
+
+
+@pytest.fixture(scope="session")
+def gpio_pin():
+    """GPIO output device for relay tests"""
+    return OutputDevice(17)
+
+
+@pytest.fixture(scope="session")
+def gpio_pwm():
+    """GPIO software PWM device for proportional actuator tests"""
+    return PWMOutputDevice(12, frequency=None)
+
+
+@pytest.fixture
+def hw_pwm():
+    """Fresh hardware PWM device mock for each proportional actuator test"""
+    return MagicMock(spec=HardwarePWM)
+
+
+@pytest.fixture
+def make_gpio_relay(gpio_pin):
+    """Factory of GPIOActuator on the shared GPIO pin"""
+
+    def _make(**kwargs):
+        return GPIOActuator(gpio_pin, **kwargs)
+
+    return _make
+
+
+@pytest.fixture
+def make_gpio_actuator(gpio_pwm):
+    """Factory of GPIOProportionalActuator on the shared GPIO PWM device"""
+
+    def _make(**kwargs):
+        return GPIOProportionalActuator(gpio_pwm, **kwargs)
+
+    return _make
+
+
+@pytest.fixture
+def make_hwpwm_actuator(hw_pwm):
+    """Factory of HWPWMProportionalActuator on the test hardware PWM device mock"""
+
+    def _make(**kwargs):
+        return HWPWMProportionalActuator(hw_pwm, **kwargs)
+
+    return _make
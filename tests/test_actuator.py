@@ -1,92 +1,111 @@
 """ Testing Relay class """
 
-import unittest
 import logging
+import pytest
 
-try:
-    from src.nts.hardware.actuator import Actuator
-except ModuleNotFoundError:
-    from nts.hardware.actuator import Actuator
+from nts.hardware.actuator import Actuator
 
+# pylint: disable=redefined-outer-name
+# Fixtures are passed to tests by name.
 
-class TestRelay(unittest.TestCase):
+
+@pytest.fixture
+def relay():
+    """Fresh normally off actuator with default label"""
+    return Actuator()
+
+
+# constructor kwargs, label, normally off, initial value
+CONSTRUCTOR_CASES = [
+    pytest.param({}, "ACTUATOR", True, 0, id="normally_off_default"),
+    pytest.param(
+        {"label": "MY RELAY", "normally_off": False},
+        "MY RELAY",
+        False,
+        1,
+        id="normally_off_false",
+    ),
+    pytest.param(
+        {"label": "MY RELAY", "normally_on": True},
+        "MY RELAY",
+        False,
+        1,
+        id="normally_on_true",
+    ),
+    pytest.param(
+        {"label": "MY RELAY", "normally_on": False},
+        "MY RELAY",
+        True,
+        0,
+        id="normally_on_false",
+    ),
+]
+
+
+@pytest.mark.parametrize("kwargs,label,normally_off,value", CONSTRUCTOR_CASES)
+def test_constructor(kwargs, label, normally_off, value) -> None:
     """
-    Test Relay class.
+    test Relay constructor.
     """
+    relay = Actuator(**kwargs)
+    assert relay.label == label
+    assert relay.normally_off == normally_off
+    assert relay.normally_on == (not normally_off)
+    assert relay.value == value
+
+
+def test_is_normally_off_mirrors_property(relay) -> None:
+    """Test private polarity accessor matches the normally_off property"""
+    # pylint: disable=protected-access
+    assert relay._is_normally_off() is relay.normally_off
 
-    def test_constructor(self) -> None:
-        """
-        test Relay constructor.
-        """
-        # pylint: disable=protected-access
-        relay = Actuator()
-        self.assertEqual(relay.label, "ACTUATOR")
-        self.assertEqual(relay._is_normally_off(), True)
-        self.assertEqual(relay.normally_off, True)
-        self.assertEqual(relay.normally_on, False)
-        self.assertEqual(relay.value, 0)
-
-        relay = Actuator(label="MY RELAY", normally_off=False, log_level=logging.DEBUG)
-        self.assertEqual(relay.label, "MY RELAY")
-        self.assertEqual(relay._is_normally_off(), False)
-        self.assertEqual(relay.normally_off, False)
-        self.assertEqual(relay.normally_on, True)
-        self.assertEqual(relay.value, 1)
-
-        relay = Actuator(label="MY RELAY", normally_on=True, log_level=logging.DEBUG)
-        self.assertEqual(relay.label, "MY RELAY")
-        self.assertEqual(relay._is_normally_off(), False)
-        self.assertEqual(relay.normally_off, False)
-        self.assertEqual(relay.normally_on, True)
-        self.assertEqual(relay.value, 1)
-
-        relay = Actuator(label="MY RELAY", normally_on=False, log_level=logging.DEBUG)
-        self.assertEqual(relay.label, "MY RELAY")
-        self.assertEqual(relay._is_normally_off(), True)
-        self.assertEqual(relay.normally_off, True)
-        self.assertEqual(relay.normally_on, False)
-        self.assertEqual(relay.value, 0)
-
-    def test_label(self):
-        """Test label property"""
-        relay = Actuator(label="MY RELAY")
-        self.assertEqual(relay.label, "MY RELAY")
-        relay.label = "SOME Label"
-        self.assertEqual(relay.label, "SOME Label")
-
-    def test_value(self):
-        """Test value property"""
-        relay = Actuator()
-        self.assertEqual(relay.value, 0)
-        self.assertEqual(relay.current_state, relay.off)
-        relay.value = 1
-        self.assertEqual(relay.value, 1)
-        self.assertEqual(relay.current_state, relay.on)
-        relay.value = 0
-        self.assertEqual(relay.value, 0)
-        self.assertEqual(relay.current_state, relay.off)
-        relay.value = 0.5
-        self.assertEqual(relay.value, 1)
-        self.assertEqual(relay.current_state, relay.on)
-        relay.value = 0.1
-        self.assertEqual(relay.value, 0)
-        self.assertEqual(relay.current_state, relay.off)
-        relay.value = 0.6
-        self.assertEqual(relay.value, 1)
-        self.assertEqual(relay.current_state, relay.on)
-
-    def test_switching(self):
-        """Test switching on and off"""
-        relay = Actuator(log_level=logging.DEBUG)
-        self.assertEqual(relay.value, 0)
-        self.assertEqual(relay.current_state, relay.off)
-        relay.switch_on()
-        self.assertEqual(relay.value, 1)
-        self.assertEqual(relay.current_state, relay.on)
-        relay.switch_off()
-        self.assertEqual(relay.value, 0)
-        self.assertEqual(relay.current_state, relay.off)
 
+def test_label(relay):
+    """Test label property"""
+    assert relay.label == "ACTUATOR"
+    relay.label = "SOME Label"
+    assert relay.label == "SOME Label"
 
-if __name__ == "__main__":
-    unittest.main()
+
+def test_value(relay):
+    """Test value property"""
+    assert (relay.value, relay.current_state) == (0, relay.off)
+    relay.value = 1
+    assert (relay.value, relay.current_state) == (1, relay.on)
+    relay.value = 0
+    assert (relay.value, relay.current_state) == (0, relay.off)
+    relay.value = 0.5
+    assert (relay.value, relay.current_state) == (1, relay.on)
+    relay.value = 0.1
+    assert (relay.value, relay.current_state) == (0, relay.off)
+    relay.value = 0.6
+    assert (relay.value, relay.current_state) == (1, relay.on)
+
+
+def test_switching(relay):
+    """Test switching on and off"""
+    assert relay.value == 0
+    relay.switch_on()
+    assert relay.value == 1
+    relay.switch_off()
+    assert relay.value == 0
+
+
+def test_state_reflects_value(relay):
+    """Test current state follows the value"""
+    for value, state in (
+        (0, relay.off),
+        (0.01, relay.off),
+        (0.5, relay.on),
+        (1, relay.on),
+    ):
+        relay.value = value
+        assert relay.current_state == state
+
+
+def test_debug_logging_emitted(caplog):
+    """Test state changes are logged at DEBUG level"""
+    relay = Actuator(label="DEBUG RELAY", log_level=logging.DEBUG)
+    with caplog.at_level(logging.DEBUG, logger="DEBUG RELAY"):
+        relay.switch_on()
+    assert "CHANGE_VALUE DEBUG RELAY is ON." in caplog.messages
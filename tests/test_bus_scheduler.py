@@ -0,0 +1,84 @@
+""" Testing RS485 bus scheduler """
+
+import asyncio
+import pytest
+
+from nts.hardware.rs485 import (
+    BusScheduler,
+    ModbusSerialConnectionConfig,
+    RS485Client,
+)
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "baudrate,gap",
+    [(9600, 3.5 * 11 / 9600), (19200, 3.5 * 11 / 19200), (115200, 1.75e-3)],
+)
+def test_for_baudrate(baudrate, gap) -> None:
+    """Test inter-frame gap calculation"""
+    assert BusScheduler.for_baudrate(baudrate).gap == pytest.approx(gap)
+
+
+def test_shared_scheduler_serializes_clients(monkeypatch) -> None:
+    """Test transactions of two clients on one bus do not overlap"""
+    events: list[tuple[str, int]] = []
+
+    async def fake_read_registers(*_args, slave: int = 1, **_kwargs):
+        events.append(("start", slave))
+        await asyncio.sleep(0.01)
+        events.append(("end", slave))
+
+    monkeypatch.setattr("nts.hardware.rs485.modbus_read_registers", fake_read_registers)
+
+    async def run() -> None:
+        bus = BusScheduler()
+        clients = [
+            RS485Client(ModbusSerialConnectionConfig(), address=i, bus_lock=bus)
+            for i in (1, 2)
+        ]
+        assert clients[0].bus_lock is clients[1].bus_lock
+        await asyncio.gather(*(client.read_registers() for client in clients))
+
+    asyncio.run(run())
+    assert [event for event, _ in events] == ["start", "end", "start", "end"]
+    assert events[0][1] == events[1][1]
+
+
+def test_next_transaction_waits_for_gap() -> None:
+    """Test next transaction starts after the inter-frame gap"""
+
+    async def run() -> float:
+        bus = BusScheduler(gap=0.05)
+        loop = asyncio.get_running_loop()
+        async with bus:
+            pass
+        released: float = loop.time()
+        async with bus:
+            return loop.time() - released
+
+    assert asyncio.run(run()) >= 0.045
+
+
+def test_cancelled_wait_releases_lock() -> None:
+    """Test lock is released when a transaction is cancelled waiting for the gap"""
+
+    async def run() -> None:
+        bus = BusScheduler(gap=10.0)
+        async with bus:
+            pass
+
+        async def transaction() -> None:
+            async with bus:
+                pass
+
+        task = asyncio.create_task(transaction())
+        await asyncio.sleep(0.01)
+        assert bus._lock is not None and bus._lock.locked()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not bus._lock.locked()
+
+    asyncio.run(run())
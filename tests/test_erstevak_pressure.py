@@ -0,0 +1,48 @@
+""" Testing Erstevak gauge pressure encoding and parsing """
+
+import pytest
+
+from nts.hardware.vacuum_gauge.erstevak.rs485 import (
+    _pressure_to_data,
+    _parse_pressure,
+)
+
+
+@pytest.mark.parametrize(
+    "pressure,data",
+    [
+        pytest.param(0.3, 300019, id="rounding"),
+        pytest.param(1.0, 100020, id="unity"),
+        pytest.param(1.234e-5, 123415, id="small"),
+        pytest.param(9.9995, 100021, id="decade-carry"),
+        pytest.param(0.0, 20, id="zero"),
+        pytest.param(-1.0, 20, id="negative"),
+    ],
+)
+def test_pressure_to_data(pressure, data) -> None:
+    """Test pressure conversion to four digits base and two digits exponent"""
+    assert _pressure_to_data(pressure) == data
+
+
+@pytest.mark.parametrize(
+    "data,pressure",
+    [
+        pytest.param(b"300019", 0.3, id="fraction"),
+        pytest.param(b"100020", 1.0, id="unity"),
+        pytest.param(b"123415", 1.234e-5, id="small"),
+        pytest.param(b"12345", 0.0, id="short"),
+        pytest.param(b"1234567", 0.0, id="long"),
+        pytest.param(b"12a456", 0.0, id="not-digits"),
+        pytest.param(b"", 0.0, id="empty"),
+    ],
+)
+def test_parse_pressure(data, pressure) -> None:
+    """Test pressure parsing from four digits base and two digits exponent"""
+    assert _parse_pressure(data) == pytest.approx(pressure)
+
+
+@pytest.mark.parametrize("pressure", [1e-9, 2.5e-6, 0.3, 1.0, 999.9, 1013.0])
+def test_pressure_round_trip(pressure) -> None:
+    """Test encoded pressure is parsed back to the same value"""
+    data: bytes = f"{_pressure_to_data(pressure):06d}".encode()
+    assert _parse_pressure(data) == pytest.approx(pressure)
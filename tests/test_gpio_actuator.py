@@ -1,125 +1,81 @@
 """ Testing Relay class """
 
-import unittest
 import logging
-from gpiozero import Device, OutputDevice  # type: ignore
-from gpiozero.pins.mock import MockFactory
+import pytest
 
-try:
-    from src.nts.hardware.actuator import GPIOActuator
-except ModuleNotFoundError:
-    from nts.hardware.actuator import GPIOActuator
+# pylint: disable=redefined-outer-name
+# Fixtures are passed to tests by name.
 
 
-Device.pin_factory = MockFactory()
+@pytest.fixture(params=[{"normally_off": True}, {"normally_on": True}])
+def relay(request, make_gpio_relay):
+    """GPIOActuator in normally off and normally on configurations"""
+    gpio_relay = make_gpio_relay(log_level=logging.DEBUG, **request.param)
+    yield gpio_relay
+    gpio_relay.value = 0
 
 
-class TestGPIORelay(unittest.TestCase):
-    """
-    Test Relay class.
-    """
-
-    pin = OutputDevice(17)
-
-    def test_constructor(self) -> None:
-        """
-        test Relay constructor.
-        """
-        # pylint: disable=protected-access
-        gpio_relay = GPIOActuator(self.pin)
-        self.assertEqual(gpio_relay.label, "GPIO ACTUATOR")
-        self.assertEqual(gpio_relay._is_normally_off(), True)
-        self.assertEqual(gpio_relay.normally_off, True)
-        self.assertEqual(gpio_relay.normally_on, False)
-        self.assertEqual(gpio_relay.value, 0)
-
-        gpio_relay = GPIOActuator(
-            self.pin, label="MY RELAY", normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_relay.label, "MY RELAY")
-        self.assertEqual(gpio_relay._is_normally_off(), False)
-        self.assertEqual(gpio_relay.normally_off, False)
-        self.assertEqual(gpio_relay.normally_on, True)
-        self.assertEqual(gpio_relay.value, 1)
-
-        gpio_relay = GPIOActuator(
-            self.pin, label="MY RELAY", normally_on=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_relay.label, "MY RELAY")
-        self.assertEqual(gpio_relay._is_normally_off(), False)
-        self.assertEqual(gpio_relay.normally_off, False)
-        self.assertEqual(gpio_relay.normally_on, True)
-        self.assertEqual(gpio_relay.value, 1)
-
-        gpio_relay = GPIOActuator(
-            self.pin, label="MY RELAY", normally_on=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_relay.label, "MY RELAY")
-        self.assertEqual(gpio_relay._is_normally_off(), True)
-        self.assertEqual(gpio_relay.normally_off, True)
-        self.assertEqual(gpio_relay.normally_on, False)
-        self.assertEqual(gpio_relay.value, 0)
+def _assert_relay(gpio_relay, gpio_pin, value):
+    """Check relay value, state and the output pin level"""
+    assert gpio_relay.value == value
+    assert gpio_relay.current_state == (gpio_relay.on if value else gpio_relay.off)
+    assert gpio_pin.value == (value if gpio_relay.normally_off else 1 - value)
 
-    def test_value(self):
-        """Test value property"""
-        gpio_relay = GPIOActuator(self.pin, normally_off=True)
-        self.assertEqual(gpio_relay.value, 0)
-        self.assertEqual(self.pin.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.off)
-        gpio_relay.value = 1
-        self.assertEqual(gpio_relay.value, 1)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.on)
-        self.assertEqual(self.pin.value, 1)
-        gpio_relay.value = 0
-        self.assertEqual(gpio_relay.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.off)
-        self.assertEqual(self.pin.value, 0)
-        gpio_relay.value = 0.5
-        self.assertEqual(gpio_relay.value, 1)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.on)
-        self.assertEqual(self.pin.value, 1)
-        gpio_relay.value = 0.1
-        self.assertEqual(gpio_relay.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.off)
-        self.assertEqual(self.pin.value, 0)
-        gpio_relay.value = 0.6
-        self.assertEqual(gpio_relay.value, 1)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.on)
-        self.assertEqual(self.pin.value, 1)
 
-        gpio_relay = GPIOActuator(self.pin, normally_on=True)
-        self.assertEqual(gpio_relay.value, 1)
-        self.assertEqual(self.pin.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.on)
-        gpio_relay.value = 0
-        self.assertEqual(gpio_relay.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.off)
-        self.assertEqual(self.pin.value, 1)
-
-    def test_switching(self):
-        """Test switching on and off"""
-        gpio_relay = GPIOActuator(self.pin, normally_off=True, log_level=logging.DEBUG)
-        self.assertEqual(gpio_relay.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.off)
-        self.assertEqual(self.pin.value, 0)
-        gpio_relay.switch_on()
-        self.assertEqual(gpio_relay.value, 1)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.on)
-        self.assertEqual(self.pin.value, 1)
-        gpio_relay.switch_off()
-        self.assertEqual(gpio_relay.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.off)
-        self.assertEqual(self.pin.value, 0)
-
-        gpio_relay = GPIOActuator(self.pin, normally_on=True, log_level=logging.DEBUG)
-        self.assertEqual(gpio_relay.value, 1)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.on)
-        self.assertEqual(self.pin.value, 0)
-        gpio_relay.switch_off()
-        self.assertEqual(gpio_relay.value, 0)
-        self.assertEqual(gpio_relay.current_state, gpio_relay.off)
-        self.assertEqual(self.pin.value, 1)
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_constructor(make_gpio_relay) -> None:
+    """
+    test Relay constructor.
+    """
+    # pylint: disable=protected-access
+    gpio_relay = make_gpio_relay()
+    assert gpio_relay.label == "GPIO ACTUATOR"
+    assert gpio_relay._is_normally_off() is True
+    assert gpio_relay.normally_off is True
+    assert gpio_relay.normally_on is False
+    assert gpio_relay.value == 0
+
+    gpio_relay = make_gpio_relay(
+        label="MY RELAY", normally_off=False, log_level=logging.DEBUG
+    )
+    assert gpio_relay.label == "MY RELAY"
+    assert gpio_relay._is_normally_off() is False
+    assert gpio_relay.normally_off is False
+    assert gpio_relay.normally_on is True
+    assert gpio_relay.value == 1
+
+    gpio_relay = make_gpio_relay(
+        label="MY RELAY", normally_on=True, log_level=logging.DEBUG
+    )
+    assert gpio_relay.label == "MY RELAY"
+    assert gpio_relay._is_normally_off() is False
+    assert gpio_relay.normally_off is False
+    assert gpio_relay.normally_on is True
+    assert gpio_relay.value == 1
+
+    gpio_relay = make_gpio_relay(
+        label="MY RELAY", normally_on=False, log_level=logging.DEBUG
+    )
+    assert gpio_relay.label == "MY RELAY"
+    assert gpio_relay._is_normally_off() is True
+    assert gpio_relay.normally_off is True
+    assert gpio_relay.normally_on is False
+    assert gpio_relay.value == 0
+
+
+def test_value(relay, gpio_pin):
+    """Test value property"""
+    _assert_relay(relay, gpio_pin, 0 if relay.normally_off else 1)
+    for value_set, value in ((1, 1), (0, 0), (0.5, 1), (0.1, 0), (0.6, 1)):
+        relay.value = value_set
+        _assert_relay(relay, gpio_pin, value)
+
+
+def test_switching(relay, gpio_pin):
+    """Test switching on and off"""
+    _assert_relay(relay, gpio_pin, 0 if relay.normally_off else 1)
+    relay.switch_on()
+    _assert_relay(relay, gpio_pin, 1)
+    relay.switch_off()
+    _assert_relay(relay, gpio_pin, 0)
+    relay.switch_on()
+    _assert_relay(relay, gpio_pin, 1)
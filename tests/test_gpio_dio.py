@@ -1,64 +1,59 @@
 """ Testing GPIO digital input and output """
 
-import unittest
+import pytest
 
 from gpiozero import OutputDevice, DigitalInputDevice  # type: ignore
 
-try:
-    from src.nts.hardware.gpio import RelayConfig, ButtonConfig, get_relay, get_button
-except ModuleNotFoundError:
-    from nts.hardware.gpio import RelayConfig, ButtonConfig, get_relay, get_button
-
-
-class TestGpio(unittest.TestCase):
-    """
-    Test GPIO Output device functionality.
-    """
-
-    def test_relay_config(self) -> None:
-        """Test RelayConfig class"""
-        rl_cfg = RelayConfig(pin_number=1)
-        self.assertEqual(rl_cfg.label, "Relay")
-        self.assertEqual(rl_cfg.backend, "gpiozero")
-        self.assertEqual(rl_cfg.pin_number, 1)
-        rl_cfg.pin_number = 3
-        self.assertEqual(rl_cfg.pin_number, 3)
-        self.assertTrue(rl_cfg.emulation)
-        self.assertTrue(rl_cfg.active_high)
-        self.assertFalse(rl_cfg.initial_value)
-
-    def test_get_relay(self) -> None:
-        """Test get_relay function"""
-        rl_cfg = RelayConfig(pin_number=1)
-        relay = get_relay(rl_cfg)
-        self.assertIsInstance(relay, OutputDevice)
-        rl_cfg = RelayConfig(pin_number=3, backend="gpiod")
-        with self.assertRaises(NotImplementedError):
-            get_relay(rl_cfg)
-        rl_cfg = RelayConfig(pin_number=3, backend="some_backend")
-        with self.assertRaises(NotImplementedError):
-            get_relay(rl_cfg)
-
-    def test_button_config(self) -> None:
-        """Test ButtonConfig class"""
-        btn_cfg = ButtonConfig(pin_number=1)
-        self.assertEqual(btn_cfg.label, "Button")
-        self.assertEqual(btn_cfg.backend, "gpiozero")
-        self.assertEqual(btn_cfg.pin_number, 1)
-        btn_cfg.pin_number = 3
-        self.assertEqual(btn_cfg.pin_number, 3)
-        self.assertTrue(btn_cfg.emulation)
-        self.assertTrue(btn_cfg.pull_up)
-        self.assertEqual(btn_cfg.bounce_time, 0.0)
-
-    def test_get_button(self) -> None:
-        """Test get_button function"""
-        btn_cfg = ButtonConfig(pin_number=1)
-        button = get_button(btn_cfg)
-        self.assertIsInstance(button, DigitalInputDevice)
-        btn_cfg = ButtonConfig(pin_number=3, backend="gpiod")
-        with self.assertRaises(NotImplementedError):
-            get_button(btn_cfg)
-        btn_cfg = ButtonConfig(pin_number=3, backend="some_backend")
-        with self.assertRaises(NotImplementedError):
-            get_button(btn_cfg)
+from nts.hardware.gpio import RelayConfig, ButtonConfig, get_relay, get_button
+
+
+def test_relay_config() -> None:
+    """Test RelayConfig class"""
+    rl_cfg = RelayConfig(pin_number=1)
+    assert rl_cfg.label == "Relay"
+    assert rl_cfg.backend == "gpiozero"
+    assert rl_cfg.pin_number == 1
+    rl_cfg.pin_number = 3
+    assert rl_cfg.pin_number == 3
+    assert rl_cfg.emulation
+    assert rl_cfg.active_high
+    assert not rl_cfg.initial_value
+
+
+def test_get_relay() -> None:
+    """Test get_relay function"""
+    rl_cfg = RelayConfig(pin_number=1)
+    relay = get_relay(rl_cfg)
+    assert isinstance(relay, OutputDevice)
+    rl_cfg = RelayConfig(pin_number=3, backend="gpiod")
+    with pytest.raises(NotImplementedError):
+        get_relay(rl_cfg)
+    rl_cfg = RelayConfig(pin_number=3, backend="some_backend")
+    with pytest.raises(NotImplementedError):
+        get_relay(rl_cfg)
+
+
+def test_button_config() -> None:
+    """Test ButtonConfig class"""
+    btn_cfg = ButtonConfig(pin_number=1)
+    assert btn_cfg.label == "Button"
+    assert btn_cfg.backend == "gpiozero"
+    assert btn_cfg.pin_number == 1
+    btn_cfg.pin_number = 3
+    assert btn_cfg.pin_number == 3
+    assert btn_cfg.emulation
+    assert btn_cfg.pull_up
+    assert btn_cfg.bounce_time == 0.0
+
+
+def test_get_button() -> None:
+    """Test get_button function"""
+    btn_cfg = ButtonConfig(pin_number=1)
+    button = get_button(btn_cfg)
+    assert isinstance(button, DigitalInputDevice)
+    btn_cfg = ButtonConfig(pin_number=3, backend="gpiod")
+    with pytest.raises(NotImplementedError):
+        get_button(btn_cfg)
+    btn_cfg = ButtonConfig(pin_number=3, backend="some_backend")
+    with pytest.raises(NotImplementedError):
+        get_button(btn_cfg)
@@ -1,147 +1,67 @@
 """ Testing GPIOProportionalActuator class """
 
-import unittest
 import logging
-from gpiozero import Device, PWMOutputDevice  # type: ignore
-from gpiozero.pins.mock import MockFactory
+import pytest
 
-try:
-    from src.nts.hardware.actuator import GPIOProportionalActuator
-except ModuleNotFoundError:
-    from nts.hardware.actuator import GPIOProportionalActuator
+from actuator_cases import VALUE_CASES, constructor_cases
 
+# constructor kwargs, label, normally off, initial value
+CONSTRUCTOR_CASES = constructor_cases("GPIO ACTUATOR")
 
-Device.pin_factory = MockFactory()
 
-
-class TestGPIOProportionalActuator(unittest.TestCase):
+@pytest.mark.parametrize("kwargs,label,normally_off,value", CONSTRUCTOR_CASES)
+def test_constructor(make_gpio_actuator, kwargs, label, normally_off, value) -> None:
     """
-    Test GPIOProportionalActuator class.
+    test GPIOProportionalActuator constructor.
     """
-
-    pwm = PWMOutputDevice(12, frequency=None, pin_factory=MockFactory())
-
-    def test_constructor(self) -> None:
-        """
-        test GPIOProportionalActuator constructor.
-        """
-        # pylint: disable=protected-access
-        gpio_actuator = GPIOProportionalActuator(self.pwm)
-        self.assertEqual(gpio_actuator.label, "GPIO ACTUATOR")
-        self.assertEqual(gpio_actuator._is_normally_off(), True)
-        self.assertEqual(gpio_actuator.normally_off, True)
-        self.assertEqual(gpio_actuator.normally_on, False)
-        self.assertEqual(gpio_actuator.value, 0)
-
-        gpio_actuator = GPIOProportionalActuator(
-            self.pwm, label="MY ACTUATOR", normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_actuator.label, "MY ACTUATOR")
-        self.assertEqual(gpio_actuator._is_normally_off(), False)
-        self.assertEqual(gpio_actuator.normally_off, False)
-        self.assertEqual(gpio_actuator.normally_on, True)
-        self.assertEqual(gpio_actuator.value, 1)
-
-        gpio_actuator = GPIOProportionalActuator(
-            self.pwm, label="MY ACTUATOR", normally_on=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_actuator.label, "MY ACTUATOR")
-        self.assertEqual(gpio_actuator._is_normally_off(), False)
-        self.assertEqual(gpio_actuator.normally_off, False)
-        self.assertEqual(gpio_actuator.normally_on, True)
-        self.assertEqual(gpio_actuator.value, 1)
-
-        gpio_actuator = GPIOProportionalActuator(
-            self.pwm, label="MY ACTUATOR", normally_on=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_actuator.label, "MY ACTUATOR")
-        self.assertEqual(gpio_actuator._is_normally_off(), True)
-        self.assertEqual(gpio_actuator.normally_off, True)
-        self.assertEqual(gpio_actuator.normally_on, False)
-        self.assertEqual(gpio_actuator.value, 0)
-
-    def test_value(self):
-        """Test value property"""
-        gpio_actuator = GPIOProportionalActuator(self.pwm, normally_off=True)
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-        gpio_actuator.value = 1
-        self.assertEqual(gpio_actuator.value, 1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = 0
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-        gpio_actuator.value = 0.5
-        self.assertEqual(gpio_actuator.value, 0.5)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = 0.1
-        self.assertEqual(gpio_actuator.value, 0.1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = 1.1
-        self.assertEqual(gpio_actuator.value, 1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = -1
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-
-        gpio_actuator = GPIOProportionalActuator(self.pwm, normally_on=True)
-        self.assertEqual(gpio_actuator.value, 1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = 0
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-        gpio_actuator.value = 0
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-        gpio_actuator.value = 0.5
-        self.assertEqual(gpio_actuator.value, 0.5)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = 0.1
-        self.assertEqual(gpio_actuator.value, 0.1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = 1.1
-        self.assertEqual(gpio_actuator.value, 1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = -1
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-
-    def test_switching(self):
-        """Test switching on and off"""
-        gpio_actuator = GPIOProportionalActuator(
-            self.pwm, normally_off=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-        gpio_actuator.switch_on()
-        self.assertEqual(gpio_actuator.value, 1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.value = 0.1
-        self.assertEqual(gpio_actuator.value, 0.1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.switch_off()
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-        gpio_actuator.switch_on()
-        self.assertEqual(gpio_actuator.value, 0.1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-
-        gpio_actuator = GPIOProportionalActuator(
-            self.pwm, normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(gpio_actuator.value, 1)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.on)
-        gpio_actuator.switch_off()
-        self.assertEqual(gpio_actuator.value, 0)
-        self.assertEqual(gpio_actuator.current_state, gpio_actuator.off)
-
-    def test_change_frequency(self):
-        """test frequency change"""
-        gpio_actuator = GPIOProportionalActuator(
-            self.pwm, normally_off=True, log_level=logging.DEBUG
-        )
-        gpio_actuator.set_frequency(2000)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    # pylint: disable=protected-access
+    gpio_actuator = make_gpio_actuator(**kwargs)
+    assert gpio_actuator.label == label
+    assert gpio_actuator._is_normally_off() == normally_off
+    assert gpio_actuator.normally_off == normally_off
+    assert gpio_actuator.normally_on == (not normally_off)
+    assert gpio_actuator.value == value
+
+
+@pytest.mark.parametrize("normally_on", [False, True])
+@pytest.mark.parametrize("value_set,value,is_on", VALUE_CASES)
+def test_value(make_gpio_actuator, normally_on, value_set, value, is_on):
+    """Test value property"""
+    gpio_actuator = make_gpio_actuator(normally_on=normally_on)
+    gpio_actuator.value = value_set
+    assert gpio_actuator.value == value
+    assert gpio_actuator.current_state == (
+        gpio_actuator.on if is_on else gpio_actuator.off
+    )
+
+
+def test_switching(make_gpio_actuator):
+    """Test switching on and off"""
+    gpio_actuator = make_gpio_actuator(normally_off=True, log_level=logging.DEBUG)
+    assert gpio_actuator.value == 0
+    assert gpio_actuator.current_state == gpio_actuator.off
+    gpio_actuator.switch_on()
+    assert gpio_actuator.value == 1
+    assert gpio_actuator.current_state == gpio_actuator.on
+    gpio_actuator.value = 0.1
+    assert gpio_actuator.value == 0.1
+    assert gpio_actuator.current_state == gpio_actuator.on
+    gpio_actuator.switch_off()
+    assert gpio_actuator.value == 0
+    assert gpio_actuator.current_state == gpio_actuator.off
+    gpio_actuator.switch_on()
+    assert gpio_actuator.value == 0.1
+    assert gpio_actuator.current_state == gpio_actuator.on
+
+    gpio_actuator = make_gpio_actuator(normally_off=False, log_level=logging.DEBUG)
+    assert gpio_actuator.value == 1
+    assert gpio_actuator.current_state == gpio_actuator.on
+    gpio_actuator.switch_off()
+    assert gpio_actuator.value == 0
+    assert gpio_actuator.current_state == gpio_actuator.off
+
+
+def test_change_frequency(make_gpio_actuator):
+    """test frequency change"""
+    gpio_actuator = make_gpio_actuator(normally_off=True, log_level=logging.DEBUG)
+    gpio_actuator.set_frequency(2000)
@@ -1,45 +1,57 @@
 """ Testing GPIO PWM """
 
-import unittest
+from dataclasses import replace
+from types import MappingProxyType
+import pytest
 
 from gpiozero import PWMOutputDevice  # type: ignore
 
-try:
-    from src.nts.hardware.gpio import PWMConfig, get_pwm
-except ModuleNotFoundError:
-    from nts.hardware.gpio import PWMConfig, get_pwm
-
-
-class TestGpioPWM(unittest.TestCase):
-    """
-    Test GPIO PWM device functionality.
-    """
-
-    def test_pwm_config(self) -> None:
-        """Test PWMConfig class"""
-        pwm_cfg = PWMConfig(pin_number=1)
-        self.assertEqual(pwm_cfg.label, "PWM")
-        self.assertEqual(pwm_cfg.backend, "gpiozero")
-        self.assertEqual(pwm_cfg.pin_number, 1)
-        pwm_cfg.pin_number = 3
-        self.assertEqual(pwm_cfg.pin_number, 3)
-        self.assertTrue(pwm_cfg.emulation)
-        self.assertTrue(pwm_cfg.active_high)
-        self.assertEqual(pwm_cfg.initial_value, 0.0)
-
-    def test_get_pwm(self) -> None:
-        """Test get_pwm function"""
-        pwm_cfg = PWMConfig(pin_number=1)
-        pwm = get_pwm(pwm_cfg)
-        self.assertIsInstance(pwm, PWMOutputDevice)
-        pwm_cfg = PWMConfig(
+from nts.hardware.gpio import PWMConfig, get_pwm
+from nts.hardware.gpio.pwm import HardwarePWM
+
+# Read-only PWM configurations shared by the tests of the module
+_PWM_CFGS = MappingProxyType(
+    {
+        "gpiozero": PWMConfig(pin_number=1),
+        "rpi_hardware_pwm": PWMConfig(
             channel=0, chip=0, frequency=5000, backend="rpi_hardware_pwm"
-        )
-        pwm = get_pwm(pwm_cfg)
-        self.assertEqual(pwm.pwm_channel, pwm_cfg.channel)
-        pwm_cfg = PWMConfig(pin_number=3, backend="gpiod")
-        with self.assertRaises(NotImplementedError):
-            get_pwm(pwm_cfg)
-        pwm_cfg = PWMConfig(pin_number=3, backend="some_backend")
-        with self.assertRaises(NotImplementedError):
+        ),
+        "gpiod": PWMConfig(pin_number=3, backend="gpiod"),
+        "some_backend": PWMConfig(pin_number=3, backend="some_backend"),
+    }
+)
+
+
+def test_pwm_config() -> None:
+    """Test PWMConfig class"""
+    pwm_cfg = replace(_PWM_CFGS["gpiozero"])
+    assert pwm_cfg.label == "PWM"
+    assert pwm_cfg.backend == "gpiozero"
+    assert pwm_cfg.pin_number == 1
+    pwm_cfg.pin_number = 3
+    assert pwm_cfg.pin_number == 3
+    assert pwm_cfg.emulation is True
+    assert pwm_cfg.active_high is True
+    assert pwm_cfg.initial_value == 0.0
+
+
+@pytest.mark.parametrize(
+    "pwm_cfg,expected_type,raises",
+    [
+        (_PWM_CFGS["gpiozero"], PWMOutputDevice, None),
+        (_PWM_CFGS["rpi_hardware_pwm"], HardwarePWM, None),
+        (_PWM_CFGS["gpiod"], None, NotImplementedError),
+        (_PWM_CFGS["some_backend"], None, NotImplementedError),
+    ],
+    ids=list(_PWM_CFGS),
+)
+def test_get_pwm(pwm_cfg, expected_type, raises) -> None:
+    """Test get_pwm function"""
+    if raises:
+        with pytest.raises(raises):
             get_pwm(pwm_cfg)
+    else:
+        pwm = get_pwm(pwm_cfg)
+        assert isinstance(pwm, expected_type)
+        if expected_type is HardwarePWM:
+            assert pwm.pwm_channel == pwm_cfg.channel
@@ -1,152 +1,68 @@
 """ Testing HWPWMProportionalActuator class """
 
-import unittest
 import logging
+import pytest
 
-# pylint: disable=ungrouped-imports
-# Conditional ungrouped import is reasonable in this case.
+from actuator_cases import VALUE_CASES, constructor_cases
 
-try:
-    from rpi_hardware_pwm import HardwarePWM  # type: ignore
-except ModuleNotFoundError:
-    try:
-        from src.nts.hardware.stubs.pwm import HardwarePWM
-    except ModuleNotFoundError:
-        from nts.hardware.stubs.pwm import HardwarePWM
-try:
-    from src.nts.hardware.actuator import HWPWMProportionalActuator
-except ModuleNotFoundError:
-    from nts.hardware.actuator import HWPWMProportionalActuator
+# constructor kwargs, label, normally off, initial value
+CONSTRUCTOR_CASES = constructor_cases("HWPWM ACTUATOR")
 
 
-class TestHWPWMProportionalActuator(unittest.TestCase):
+@pytest.mark.parametrize("kwargs,label,normally_off,value", CONSTRUCTOR_CASES)
+def test_constructor(make_hwpwm_actuator, kwargs, label, normally_off, value) -> None:
     """
-    Test HWPWMProportionalActuator class.
+    test HWPWMProportionalActuator constructor.
     """
-
-    pwm = HardwarePWM(0, 4000, 0)
-
-    def test_constructor(self) -> None:
-        """
-        test HWPWMProportionalActuator constructor.
-        """
-        # pylint: disable=protected-access
-        hwpwm_actuator = HWPWMProportionalActuator(self.pwm)
-        self.assertEqual(hwpwm_actuator.label, "HWPWM ACTUATOR")
-        self.assertEqual(hwpwm_actuator._is_normally_off(), True)
-        self.assertEqual(hwpwm_actuator.normally_off, True)
-        self.assertEqual(hwpwm_actuator.normally_on, False)
-        self.assertEqual(hwpwm_actuator.value, 0)
-
-        hwpwm_actuator = HWPWMProportionalActuator(
-            self.pwm, label="MY ACTUATOR", normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(hwpwm_actuator.label, "MY ACTUATOR")
-        self.assertEqual(hwpwm_actuator._is_normally_off(), False)
-        self.assertEqual(hwpwm_actuator.normally_off, False)
-        self.assertEqual(hwpwm_actuator.normally_on, True)
-        self.assertEqual(hwpwm_actuator.value, 1)
-
-        hwpwm_actuator = HWPWMProportionalActuator(
-            self.pwm, label="MY ACTUATOR", normally_on=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(hwpwm_actuator.label, "MY ACTUATOR")
-        self.assertEqual(hwpwm_actuator._is_normally_off(), False)
-        self.assertEqual(hwpwm_actuator.normally_off, False)
-        self.assertEqual(hwpwm_actuator.normally_on, True)
-        self.assertEqual(hwpwm_actuator.value, 1)
-
-        hwpwm_actuator = HWPWMProportionalActuator(
-            self.pwm, label="MY ACTUATOR", normally_on=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(hwpwm_actuator.label, "MY ACTUATOR")
-        self.assertEqual(hwpwm_actuator._is_normally_off(), True)
-        self.assertEqual(hwpwm_actuator.normally_off, True)
-        self.assertEqual(hwpwm_actuator.normally_on, False)
-        self.assertEqual(hwpwm_actuator.value, 0)
-
-    def test_value(self):
-        """Test value property"""
-        hwpwm_actuator = HWPWMProportionalActuator(self.pwm, normally_off=True)
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-        hwpwm_actuator.value = 1
-        self.assertEqual(hwpwm_actuator.value, 1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = 0
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-        hwpwm_actuator.value = 0.5
-        self.assertEqual(hwpwm_actuator.value, 0.5)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = 0.1
-        self.assertEqual(hwpwm_actuator.value, 0.1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = 1.1
-        self.assertEqual(hwpwm_actuator.value, 1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = -1
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-
-        hwpwm_actuator = HWPWMProportionalActuator(self.pwm, normally_on=True)
-        self.assertEqual(hwpwm_actuator.value, 1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = 0
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-        hwpwm_actuator.value = 0
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-        hwpwm_actuator.value = 0.5
-        self.assertEqual(hwpwm_actuator.value, 0.5)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = 0.1
-        self.assertEqual(hwpwm_actuator.value, 0.1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = 1.1
-        self.assertEqual(hwpwm_actuator.value, 1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = -1
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-
-    def test_switching(self):
-        """Test switching on and off"""
-        hwpwm_actuator = HWPWMProportionalActuator(
-            self.pwm, normally_off=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-        hwpwm_actuator.switch_on()
-        self.assertEqual(hwpwm_actuator.value, 1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.value = 0.1
-        self.assertEqual(hwpwm_actuator.value, 0.1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.switch_off()
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-        hwpwm_actuator.switch_on()
-        self.assertEqual(hwpwm_actuator.value, 0.1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-
-        hwpwm_actuator = HWPWMProportionalActuator(
-            self.pwm, normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(hwpwm_actuator.value, 1)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.on)
-        hwpwm_actuator.switch_off()
-        self.assertEqual(hwpwm_actuator.value, 0)
-        self.assertEqual(hwpwm_actuator.current_state, hwpwm_actuator.off)
-
-    def test_change_frequency(self):
-        """Test frequency change"""
-        hwpwm_actuator = HWPWMProportionalActuator(
-            self.pwm, normally_off=True, log_level=logging.DEBUG
-        )
-        hwpwm_actuator.set_frequency(2000)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    # pylint: disable=protected-access
+    hwpwm_actuator = make_hwpwm_actuator(**kwargs)
+    assert hwpwm_actuator.label == label
+    assert hwpwm_actuator._is_normally_off() == normally_off
+    assert hwpwm_actuator.normally_off == normally_off
+    assert hwpwm_actuator.normally_on == (not normally_off)
+    assert hwpwm_actuator.value == value
+
+
+@pytest.mark.parametrize("normally_on", [False, True])
+@pytest.mark.parametrize("value_set,value,is_on", VALUE_CASES)
+def test_value(make_hwpwm_actuator, normally_on, value_set, value, is_on):
+    """Test value property"""
+    hwpwm_actuator = make_hwpwm_actuator(normally_on=normally_on)
+    hwpwm_actuator.value = value_set
+    assert hwpwm_actuator.value == value
+    assert hwpwm_actuator.current_state == (
+        hwpwm_actuator.on if is_on else hwpwm_actuator.off
+    )
+
+
+def test_switching(make_hwpwm_actuator):
+    """Test switching on and off"""
+    hwpwm_actuator = make_hwpwm_actuator(normally_off=True, log_level=logging.DEBUG)
+    assert hwpwm_actuator.value == 0
+    assert hwpwm_actuator.current_state == hwpwm_actuator.off
+    hwpwm_actuator.switch_on()
+    assert hwpwm_actuator.value == 1
+    assert hwpwm_actuator.current_state == hwpwm_actuator.on
+    hwpwm_actuator.value = 0.1
+    assert hwpwm_actuator.value == 0.1
+    assert hwpwm_actuator.current_state == hwpwm_actuator.on
+    hwpwm_actuator.switch_off()
+    assert hwpwm_actuator.value == 0
+    assert hwpwm_actuator.current_state == hwpwm_actuator.off
+    hwpwm_actuator.switch_on()
+    assert hwpwm_actuator.value == 0.1
+    assert hwpwm_actuator.current_state == hwpwm_actuator.on
+
+    hwpwm_actuator = make_hwpwm_actuator(normally_off=False, log_level=logging.DEBUG)
+    assert hwpwm_actuator.value == 1
+    assert hwpwm_actuator.current_state == hwpwm_actuator.on
+    hwpwm_actuator.switch_off()
+    assert hwpwm_actuator.value == 0
+    assert hwpwm_actuator.current_state == hwpwm_actuator.off
+
+
+def test_change_frequency(make_hwpwm_actuator, hw_pwm):
+    """Test frequency change"""
+    hwpwm_actuator = make_hwpwm_actuator(normally_off=True, log_level=logging.DEBUG)
+    hwpwm_actuator.set_frequency(2000)
+    hw_pwm.change_frequency.assert_called_with(2000)
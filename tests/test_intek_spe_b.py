@@ -0,0 +1,34 @@
+""" Testing Intek SPE-B VFD error clearing """
+
+import asyncio
+from unittest.mock import AsyncMock
+import pytest
+
+from pymodbus.pdu import ExceptionResponse
+
+from nts.hardware.rs485 import ModbusSerialConnectionConfig
+from nts.hardware.vfd.intek_spe_b import VFDIntekSPEb
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "response,supported",
+    [
+        pytest.param(None, True, id="no-response"),
+        pytest.param(ExceptionResponse(0x17, 4, slave=1), True, id="device-failure"),
+        pytest.param(ExceptionResponse(0x17, 1, slave=1), False, id="illegal-function"),
+    ],
+)
+def test_clear_error_fallback(monkeypatch, response, supported) -> None:
+    """Only an illegal function exception disables read/write registers"""
+    monkeypatch.setattr(
+        "nts.hardware.rs485.modbus_read_write_registers",
+        AsyncMock(return_value=response),
+    )
+    vfd = VFDIntekSPEb(ModbusSerialConnectionConfig(), retries=1)
+    vfd._write_reg = AsyncMock()
+    vfd._read_reg = AsyncMock(return_value=0)
+    assert asyncio.run(vfd.clear_error()) == 0
+    assert vfd._read_write_supported is supported
+    vfd._write_reg.assert_awaited_once_with(0x2000, 7)
@@ -1,107 +1,63 @@
 """ Testing ProportionalActuator class """
 
-import unittest
 import logging
+import pytest
 
-try:
-    from src.nts.hardware.actuator import ProportionalActuator
-except ModuleNotFoundError:
-    from nts.hardware.actuator import ProportionalActuator
+from actuator_cases import VALUE_CASES, constructor_cases
 
+from nts.hardware.actuator import ProportionalActuator
 
-class TestProportionalActuator(unittest.TestCase):
-    """
-    Test ProportionalActuator class.
-    """
-
-    def test_constructor(self) -> None:
-        """
-        test ProportionalActuator constructor.
-        """
-        # pylint: disable=protected-access
-        actuator = ProportionalActuator()
-        self.assertEqual(actuator.label, "ACTUATOR")
-        self.assertEqual(actuator._is_normally_off(), True)
-        self.assertEqual(actuator.normally_off, True)
-        self.assertEqual(actuator.normally_on, False)
-        self.assertEqual(actuator.value, 0)
-
-        actuator = ProportionalActuator(
-            label="MY ACTUATOR", normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(actuator.label, "MY ACTUATOR")
-        self.assertEqual(actuator._is_normally_off(), False)
-        self.assertEqual(actuator.normally_off, False)
-        self.assertEqual(actuator.normally_on, True)
-        self.assertEqual(actuator.value, 1)
-
-        actuator = ProportionalActuator(
-            label="MY ACTUATOR", normally_on=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(actuator.label, "MY ACTUATOR")
-        self.assertEqual(actuator._is_normally_off(), False)
-        self.assertEqual(actuator.normally_off, False)
-        self.assertEqual(actuator.normally_on, True)
-        self.assertEqual(actuator.value, 1)
+# constructor kwargs, label, normally off, initial value
+CONSTRUCTOR_CASES = constructor_cases("ACTUATOR")
 
-        actuator = ProportionalActuator(
-            label="MY ACTUATOR", normally_on=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(actuator.label, "MY ACTUATOR")
-        self.assertEqual(actuator._is_normally_off(), True)
-        self.assertEqual(actuator.normally_off, True)
-        self.assertEqual(actuator.normally_on, False)
-        self.assertEqual(actuator.value, 0)
 
-    def test_label(self):
-        """Test label property"""
-        actuator = ProportionalActuator(label="MY ACTUATOR")
-        self.assertEqual(actuator.label, "MY ACTUATOR")
-        actuator.label = "SOME Label"
-        self.assertEqual(actuator.label, "SOME Label")
+def _assert_state(actuator, value, is_on):
+    """Check actuator value and state"""
+    assert actuator.value == value
+    assert actuator.current_state == (actuator.on if is_on else actuator.off)
 
-    def test_value(self):
-        """Test value property"""
-        actuator = ProportionalActuator()
-        self.assertEqual(actuator.value, 0)
-        self.assertEqual(actuator.current_state, actuator.off)
-        actuator.value = 1
-        self.assertEqual(actuator.value, 1)
-        self.assertEqual(actuator.current_state, actuator.on)
-        actuator.value = 0
-        self.assertEqual(actuator.value, 0)
-        self.assertEqual(actuator.current_state, actuator.off)
-        actuator.value = 0.5
-        self.assertEqual(actuator.value, 0.5)
-        self.assertEqual(actuator.current_state, actuator.on)
-        actuator.value = 0.1
-        self.assertEqual(actuator.value, 0.1)
-        self.assertEqual(actuator.current_state, actuator.on)
-        actuator.value = 1.1
-        self.assertEqual(actuator.value, 1)
-        self.assertEqual(actuator.current_state, actuator.on)
-        actuator.value = -1
-        self.assertEqual(actuator.value, 0)
-        self.assertEqual(actuator.current_state, actuator.off)
 
-    def test_switching(self):
-        """Test switching on and off"""
-        actuator = ProportionalActuator(log_level=logging.DEBUG)
-        self.assertEqual(actuator.value, 0)
-        self.assertEqual(actuator.current_state, actuator.off)
-        actuator.switch_on()
-        self.assertEqual(actuator.value, 1)
-        self.assertEqual(actuator.current_state, actuator.on)
-        actuator.value = 0.1
-        self.assertEqual(actuator.value, 0.1)
-        self.assertEqual(actuator.current_state, actuator.on)
-        actuator.switch_off()
-        self.assertEqual(actuator.value, 0)
-        self.assertEqual(actuator.current_state, actuator.off)
-        actuator.switch_on()
-        self.assertEqual(actuator.value, 0.1)
-        self.assertEqual(actuator.current_state, actuator.on)
-
-
-if __name__ == "__main__":
-    unittest.main()
+@pytest.mark.parametrize("kwargs,label,normally_off,value", CONSTRUCTOR_CASES)
+def test_constructor(kwargs, label, normally_off, value) -> None:
+    """
+    test ProportionalActuator constructor.
+    """
+    # pylint: disable=protected-access
+    actuator = ProportionalActuator(**kwargs)
+    assert actuator.label == label
+    assert actuator._is_normally_off() == normally_off
+    assert actuator.normally_off == normally_off
+    assert actuator.normally_on == (not normally_off)
+    assert actuator.value == value
+
+
+def test_label():
+    """Test label property"""
+    actuator = ProportionalActuator(label="MY ACTUATOR")
+    assert actuator.label == "MY ACTUATOR"
+    actuator.label = "SOME Label"
+    assert actuator.label == "SOME Label"
+
+
+@pytest.mark.parametrize("value_set,value,is_on", VALUE_CASES)
+def test_value(value_set, value, is_on):
+    """Test value property"""
+    actuator = ProportionalActuator()
+    actuator.value = value_set
+    _assert_state(actuator, value, is_on)
+
+
+@pytest.mark.parametrize("log_kwargs", [{}, {"log_level": logging.DEBUG}])
+@pytest.mark.parametrize("normally_off", [True, False])
+def test_switching(log_kwargs, normally_off):
+    """Test switching on and off"""
+    actuator = ProportionalActuator(normally_off=normally_off, **log_kwargs)
+    _assert_state(actuator, 0 if normally_off else 1, not normally_off)
+    actuator.switch_on()
+    _assert_state(actuator, 1, True)
+    actuator.value = 0.1
+    _assert_state(actuator, 0.1, True)
+    actuator.switch_off()
+    _assert_state(actuator, 0, False)
+    actuator.switch_on()
+    _assert_state(actuator, 0.1, True)
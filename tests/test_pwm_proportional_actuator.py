@@ -1,196 +1,210 @@
 """ Testing PWMProportionalActuator class """
 
-import unittest
 import logging
+import pytest
 
-try:
-    from src.nts.hardware.actuator import PWMProportionalActuator
-except ModuleNotFoundError:
-    from nts.hardware.actuator import PWMProportionalActuator
+from nts.hardware.actuator import PWMProportionalActuator
 
+# State sentinels are class-level constants of the state machine
+ON, OFF = PWMProportionalActuator.on, PWMProportionalActuator.off
 
-class TestPWMProportionalActuator(unittest.TestCase):
-    """
-    Test PWMProportionalActuator class.
-    """
+# Default and limiting PWM actuator ranges
+MIN_FREQ, MAX_FREQ = 1e-3, 1e6
+DEFAULT_FREQ_RANGE = (MIN_FREQ, MAX_FREQ)
+DEFAULT_PWM_RANGE = (0.0, 1.0)
 
-    def test_constructor(self) -> None:
-        """
-        test PWMProportionalActuator constructor.
-        """
-        # pylint: disable=protected-access
-        pwm_actuator = PWMProportionalActuator()
-        self.assertEqual(pwm_actuator.label, "PWM ACTUATOR")
-        self.assertEqual(pwm_actuator._is_normally_off(), True)
-        self.assertEqual(pwm_actuator.normally_off, True)
-        self.assertEqual(pwm_actuator.normally_on, False)
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.pwm_range, (0.0, 1.0))
-        self.assertEqual(pwm_actuator.pwm_value, 0.0)
-        self.assertEqual(pwm_actuator.frequency_range, (1e-3, 1e6))
-
-        pwm_actuator = PWMProportionalActuator(
-            label="MY ACTUATOR", normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(pwm_actuator.label, "MY ACTUATOR")
-        self.assertEqual(pwm_actuator._is_normally_off(), False)
-        self.assertEqual(pwm_actuator.normally_off, False)
-        self.assertEqual(pwm_actuator.normally_on, True)
-        self.assertEqual(pwm_actuator.value, 1)
-
-        pwm_actuator = PWMProportionalActuator(
-            label="MY ACTUATOR", normally_on=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(pwm_actuator.label, "MY ACTUATOR")
-        self.assertEqual(pwm_actuator._is_normally_off(), False)
-        self.assertEqual(pwm_actuator.normally_off, False)
-        self.assertEqual(pwm_actuator.normally_on, True)
-        self.assertEqual(pwm_actuator.value, 1)
-
-        pwm_actuator = PWMProportionalActuator(
-            label="MY ACTUATOR", normally_on=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(pwm_actuator.label, "MY ACTUATOR")
-        self.assertEqual(pwm_actuator._is_normally_off(), True)
-        self.assertEqual(pwm_actuator.normally_off, True)
-        self.assertEqual(pwm_actuator.normally_on, False)
-        self.assertEqual(pwm_actuator.value, 0)
-
-    def test_frequency_range(self):
-        """test frequency_range property"""
-        pwm_actuator = PWMProportionalActuator()
-        self.assertEqual(pwm_actuator.frequency_range, (1e-3, 1e6))
-        pwm_actuator.frequency_range = (1.0, 3e3)
-        self.assertEqual(pwm_actuator.frequency_range, (1.0, 3e3))
-        pwm_actuator.frequency_range = [10.0, 30e3]
-        self.assertEqual(pwm_actuator.frequency_range, (10.0, 30e3))
-        pwm_actuator.frequency_range = [20e3, 15.0]
-        self.assertEqual(pwm_actuator.frequency_range, (15.0, 20e3))
-        pwm_actuator.frequency_range = [-20, 150.0e3]
-        self.assertEqual(pwm_actuator.frequency_range, (1e-3, 150e3))
-        pwm_actuator.frequency_range = [-20, 2.0e6]
-        self.assertEqual(pwm_actuator.frequency_range, (1e-3, 1e6))
-        pwm_actuator.frequency_range = [3e6, 2.0e6]
-        self.assertEqual(pwm_actuator.frequency_range, (1e6, 1e6))
-
-    def test_pwm_range(self):
-        """test pwm_range property"""
-        pwm_actuator = PWMProportionalActuator()
-        self.assertEqual(pwm_actuator.pwm_range, (0, 1))
-        pwm_actuator.pwm_range = (0.2, 0.9)
-        self.assertEqual(pwm_actuator.pwm_range, (0.2, 0.9))
-        pwm_actuator.pwm_range = [0.1, 0.8]
-        self.assertEqual(pwm_actuator.pwm_range, (0.1, 0.8))
-        pwm_actuator.pwm_range = [20e3, 15.0]
-        self.assertEqual(pwm_actuator.pwm_range, (1.0, 1.0))
-        pwm_actuator.pwm_range = [-20, 150.0e3]
-        self.assertEqual(pwm_actuator.pwm_range, (0, 1))
-        pwm_actuator.pwm_range = [-20, 0.8]
-        self.assertEqual(pwm_actuator.pwm_range, (0, 0.8))
-
-    def test_set_frequency(self):
-        """test set_frequency method"""
-        pwm_actuator = PWMProportionalActuator()
-        pwm_actuator.set_frequency(-2e7)
-        pwm_actuator.set_frequency(2e7)
-        pwm_actuator.set_frequency(1e3)
-
-    def test_value_norm_off(self):
-        """Test value property"""
-        pwm_actuator = PWMProportionalActuator(normally_off=True)
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.pwm_value, 0)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.off)
-        pwm_actuator.value = 1
-        self.assertEqual(pwm_actuator.value, 1)
-        self.assertEqual(pwm_actuator.pwm_value, 1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = 0
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.pwm_value, 0)
-        pwm_actuator.value = 0.5
-        self.assertEqual(pwm_actuator.value, 0.5)
-        self.assertEqual(pwm_actuator.pwm_value, 0.5)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = 1.1
-        self.assertEqual(pwm_actuator.value, 1)
-        self.assertEqual(pwm_actuator.pwm_value, 1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = -1
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.pwm_value, 0)
-        pwm_actuator.pwm_range = (0.2, 0.6)
-        self.assertEqual(pwm_actuator.pwm_value, 0.2)
-        pwm_actuator.value = 1
-        self.assertEqual(pwm_actuator.value, 1)
-        self.assertEqual(pwm_actuator.pwm_value, 0.6)
-        pwm_actuator.value = 0.5
-        self.assertEqual(pwm_actuator.value, 0.5)
-        self.assertEqual(pwm_actuator.pwm_value, 0.4)
-
-    def test_value_norm_on(self):
-        """Test value property"""
-        pwm_actuator = PWMProportionalActuator(normally_on=True)
-        self.assertEqual(pwm_actuator.value, 1)
-        self.assertEqual(pwm_actuator.pwm_value, 0)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = 0
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.pwm_value, 1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.off)
-        pwm_actuator.value = 0.5
-        self.assertEqual(pwm_actuator.value, 0.5)
-        self.assertEqual(pwm_actuator.pwm_value, 0.5)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = 0.1
-        self.assertEqual(pwm_actuator.value, 0.1)
-        self.assertEqual(pwm_actuator.pwm_value, 0.9)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = 1.1
-        self.assertEqual(pwm_actuator.value, 1)
-        self.assertEqual(pwm_actuator.pwm_value, 0)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = -1
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.pwm_value, 1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.off)
-
-    def test_switching(self):
-        """Test switching on and off"""
-        pwm_actuator = PWMProportionalActuator(
-            normally_off=True, log_level=logging.DEBUG
-        )
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.off)
-        pwm_actuator.switch_on()
-        self.assertEqual(pwm_actuator.value, 1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.value = 0.1
-        self.assertEqual(pwm_actuator.value, 0.1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.switch_off()
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.off)
-        pwm_actuator.switch_on()
-        self.assertEqual(pwm_actuator.value, 0.1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
+# pylint: disable=redefined-outer-name
+# Fixtures are passed to tests by name.
 
-        pwm_actuator = PWMProportionalActuator(
-            normally_off=False, log_level=logging.DEBUG
-        )
-        self.assertEqual(pwm_actuator.value, 1)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.on)
-        pwm_actuator.switch_off()
-        self.assertEqual(pwm_actuator.value, 0)
-        self.assertEqual(pwm_actuator.current_state, pwm_actuator.off)
 
-    def test_change_frequency(self):
-        """test frequency change"""
-        gpio_actuator = PWMProportionalActuator(
-            normally_off=True, log_level=logging.DEBUG
-        )
-        gpio_actuator.set_frequency(2000)
+@pytest.fixture
+def pwm_off():
+    """Fresh normally off PWM actuator"""
+    return PWMProportionalActuator(normally_off=True)
+
 
+@pytest.fixture
+def pwm_on():
+    """Fresh normally on PWM actuator"""
+    return PWMProportionalActuator(normally_on=True)
 
-if __name__ == "__main__":
-    unittest.main()
+
+@pytest.fixture(scope="module")
+def pwm_shared():
+    """Normally off PWM actuator shared by tests that leave its state intact"""
+    return PWMProportionalActuator(normally_off=True)
+
+
+# constructor kwargs, label, normally off, initial value
+CONSTRUCTOR_CASES = [
+    pytest.param({}, "PWM ACTUATOR", True, 0, id="normally_off_default"),
+    pytest.param(
+        {"label": "MY ACTUATOR", "normally_off": False},
+        "MY ACTUATOR",
+        False,
+        1,
+        id="normally_off_false",
+    ),
+]
+
+# constructor kwargs resulting in the same polarity and initial value
+EQUIV_KWARGS = [
+    pytest.param({"normally_off": False}, {"normally_on": True}, id="normally_on"),
+    pytest.param({}, {"normally_on": False}, id="normally_off"),
+]
+
+
+def _readout(pwm_actuator):
+    """Actuator value and PWM value as a single tuple"""
+    return pwm_actuator.value, pwm_actuator.pwm_value
+
+
+@pytest.mark.parametrize("kwargs,label,normally_off,value", CONSTRUCTOR_CASES)
+def test_constructor(kwargs, label, normally_off, value) -> None:
+    """
+    test PWMProportionalActuator constructor.
+    """
+    pwm_actuator = PWMProportionalActuator(**kwargs)
+    assert pwm_actuator.label == label
+    assert pwm_actuator.normally_off == normally_off
+    assert pwm_actuator.normally_on == (not normally_off)
+    assert pwm_actuator.value == value
+    assert pwm_actuator.pwm_range == DEFAULT_PWM_RANGE
+    assert pwm_actuator.pwm_value == 0.0
+    assert pwm_actuator.frequency_range == DEFAULT_FREQ_RANGE
+
+
+def test_is_normally_off_mirrors_property(pwm_off) -> None:
+    """Test private polarity accessor matches the normally_off property"""
+    # pylint: disable=protected-access
+    assert pwm_off._is_normally_off() is pwm_off.normally_off
+
+
+@pytest.mark.parametrize("kwargs,equivalent_kwargs", EQUIV_KWARGS)
+def test_constructor_equivalent_kwargs(kwargs, equivalent_kwargs) -> None:
+    """Test normally_on is the inverse of normally_off in the constructor"""
+    pwm_actuator = PWMProportionalActuator(**kwargs)
+    equivalent = PWMProportionalActuator(**equivalent_kwargs)
+    assert (equivalent.normally_off, equivalent.normally_on, equivalent.value) == (
+        pwm_actuator.normally_off,
+        pwm_actuator.normally_on,
+        pwm_actuator.value,
+    )
+
+
+# frequency range assigned, frequency range expected
+FREQ_CASES = [
+    ((1.0, 3e3), (1.0, 3e3)),
+    ([10.0, 30e3], (10.0, 30e3)),
+    ([20e3, 15.0], (15.0, 20e3)),
+    ([-20, 150.0e3], (MIN_FREQ, 150e3)),
+    ([-20, 2.0e6], DEFAULT_FREQ_RANGE),
+    ([3e6, 2.0e6], (MAX_FREQ, MAX_FREQ)),
+]
+
+# PWM range assigned, clamped or reordered PWM range expected
+PWM_CASES = [
+    ([0.8, 0.1], (0.1, 0.8)),
+    ([20e3, 15.0], (1.0, 1.0)),
+    ([-20, 150.0e3], DEFAULT_PWM_RANGE),
+    ([-20, 0.8], (0, 0.8)),
+]
+
+
+@pytest.mark.parametrize("assign,expected", FREQ_CASES)
+def test_frequency_range(pwm_off, assign, expected):
+    """test frequency_range property"""
+    pwm_off.frequency_range = assign
+    assert pwm_off.frequency_range == expected
+
+
+@pytest.mark.parametrize("assign,expected", PWM_CASES)
+def test_pwm_range(pwm_off, assign, expected):
+    """test pwm_range property"""
+    pwm_off.pwm_range = assign
+    assert pwm_off.pwm_range == expected
+
+
+def test_pwm_range_round_trip(pwm_off):
+    """test valid pwm_range is stored as is"""
+    pwm_off.pwm_range = (0.2, 0.9)
+    assert pwm_off.pwm_range == (0.2, 0.9)
+
+
+def test_set_frequency(pwm_off):
+    """test set_frequency method"""
+    pwm_actuator = pwm_off
+    pwm_actuator.set_frequency(-2e7)
+    pwm_actuator.set_frequency(2e7)
+    pwm_actuator.set_frequency(1e3)
+
+
+def _expected_value(value_set):
+    """Actuator value expected after setting value_set"""
+    return max(0.0, min(1.0, value_set))
+
+
+def _expected_pwm(value_set, normally_off, pwm_min=0.0, pwm_max=1.0):
+    """PWM value expected after setting value_set"""
+    pwm_value = pwm_min + (pwm_max - pwm_min) * _expected_value(value_set)
+    return pwm_value if normally_off else pwm_min + pwm_max - pwm_value
+
+
+@pytest.mark.parametrize("actuator_fixture", ["pwm_off", "pwm_on"])
+@pytest.mark.parametrize("pwm_range", [DEFAULT_PWM_RANGE, (0.2, 0.6)])
+@pytest.mark.parametrize("value_set", [1, 0, 0.5, 0.1, 1.1, -1])
+def test_value(request, actuator_fixture, pwm_range, value_set):
+    """Test value property and PWM value scaling for both polarities"""
+    pwm_actuator = request.getfixturevalue(actuator_fixture)
+    pwm_actuator.pwm_range = pwm_range
+    pwm_actuator.value = value_set
+    assert _readout(pwm_actuator) == pytest.approx(
+        (
+            _expected_value(value_set),
+            _expected_pwm(value_set, pwm_actuator.normally_off, *pwm_range),
+        )
+    )
+
+
+@pytest.mark.parametrize("actuator_fixture", ["pwm_off", "pwm_on"])
+@pytest.mark.parametrize(
+    "value_set,state", [(0, OFF), (1e-6, ON), (0.5, ON), (1, ON), (1.1, ON), (-1, OFF)]
+)
+def test_state_mapping(request, actuator_fixture, value_set, state):
+    """Test actuator is on for any positive value and off otherwise"""
+    pwm_actuator = request.getfixturevalue(actuator_fixture)
+    pwm_actuator.value = value_set
+    assert pwm_actuator.current_state == state
+
+
+@pytest.mark.parametrize("actuator_fixture", ["pwm_off", "pwm_on"])
+def test_switching(request, actuator_fixture):
+    """Test switching on and off"""
+    pwm_actuator = request.getfixturevalue(actuator_fixture)
+    assert pwm_actuator.value == (0 if pwm_actuator.normally_off else 1)
+    pwm_actuator.switch_on()
+    assert pwm_actuator.value == 1
+    pwm_actuator.value = 0.1
+    assert pwm_actuator.value == 0.1
+    pwm_actuator.switch_off()
+    assert pwm_actuator.value == 0
+    pwm_actuator.switch_on()
+    assert pwm_actuator.value == 0.1
+
+
+def test_change_frequency(pwm_shared):
+    """test frequency change"""
+    pwm_shared.set_frequency(2000)
+
+
+def test_debug_logging(caplog):
+    """Test state changes are logged at DEBUG level"""
+    pwm_actuator = PWMProportionalActuator(
+        label="DEBUG ACTUATOR", normally_off=True, log_level=logging.DEBUG
+    )
+    with caplog.at_level(logging.DEBUG, logger="DEBUG ACTUATOR"):
+        pwm_actuator.switch_on()
+        pwm_actuator.switch_off()
+    messages = [record.getMessage() for record in caplog.records]
+    assert "CHANGE_VALUE DEBUG ACTUATOR is ON." in messages
+    assert "CHANGE_VALUE DEBUG ACTUATOR is OFF." in messages
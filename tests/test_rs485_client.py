@@ -0,0 +1,47 @@
+""" Testing RS485 MODBUS client """
+
+import asyncio
+from unittest.mock import AsyncMock
+import pytest
+
+from pymodbus.pdu import ExceptionResponse
+
+from nts.hardware.rs485 import (
+    ModbusSerialConnectionConfig,
+    RS485Client,
+    RS485ClientBase,
+)
+
+# pylint: disable=protected-access,abstract-method,abstract-class-instantiated
+
+
+def test_parse_exception_response() -> None:
+    """Test MODBUS exception response is parsed without register data"""
+    client = RS485Client(ModbusSerialConnectionConfig())
+    parsed = client._parse_response(bytes((1, 0x83, 2, 0, 0)))
+    assert parsed.addr == 1
+    assert parsed.cmd == 0x83
+    assert parsed.exception_code == 2
+    assert parsed.data == ()
+
+
+def test_exception_reply_is_retried(monkeypatch) -> None:
+    """Test register helpers retry on an exception reply and return zero"""
+    read = AsyncMock(return_value=ExceptionResponse(0x03, 2, slave=1))
+    monkeypatch.setattr("nts.hardware.rs485.modbus_read_registers", read)
+    client = RS485Client(ModbusSerialConnectionConfig(), retries=3)
+    assert asyncio.run(client.read_single_register_float(0x1000)) == 0.0
+    assert read.await_count == 3
+    assert asyncio.run(client.read_two_registers_data(0x1000)) == 0.0
+    assert read.await_count == 6
+    assert asyncio.run(client.read_single_register_uint16(0x1000)) == 0
+
+
+def test_base_requires_parser() -> None:
+    """Test client base without a response parser can not be created"""
+
+    class NoParser(RS485ClientBase):
+        """Client without a response parser"""
+
+    with pytest.raises(TypeError):
+        NoParser(ModbusSerialConnectionConfig())
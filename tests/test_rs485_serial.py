@@ -0,0 +1,10 @@
+""" Testing RS485 serial helper functions """
+
+from nts.hardware.rs485.serial import check_sum
+
+
+def test_check_sum() -> None:
+    """Test CRC-16/MODBUS check value"""
+    assert check_sum(b"123456789") == 0x4B37
+    assert check_sum(memoryview(b"123456789")) == 0x4B37
+    assert check_sum(b"") == 0xFFFF